@@ -10,7 +10,6 @@ import os
 import logging
 import time
 import json
-import traceback
 import datetime
 import threading
 import platform
@@ -462,7 +461,7 @@ class YouTubeAPIValidator:
             
         except Exception as e:
             logging.error(f"Ошибка при загрузке API ключей: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
     
     def _create_empty_api_file(self):
@@ -663,7 +662,7 @@ class YouTubeAPIValidator:
             self.update_analytics(api_key, "unexpected_error", 0)
             
             logging.error(f"Неожиданная ошибка при проверке API ключа {api_key[:5]}...{api_key[-5:]}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False, "error", quota_info
     
     def save_valid_keys(self):
@@ -698,7 +697,7 @@ class YouTubeAPIValidator:
             
         except Exception as e:
             logging.error(f"Ошибка при сохранении валидных API ключей: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
     
     def _save_categorized_keys(self):
@@ -815,7 +814,7 @@ class YouTubeAPIValidator:
                             
                     except Exception as e:
                         logging.error(f"Ошибка при обработке результата для ключа {api_key[:5]}...{api_key[-5:]}: {str(e)}")
-                        logging.debug(traceback.format_exc())
+                        logging.debug("Exception details:", exc_info=True)
                         
                         # Обновляем прогресс даже в случае ошибки
                         self.processed_keys += 1
@@ -825,7 +824,7 @@ class YouTubeAPIValidator:
             
             except Exception as e:
                 logging.error(f"Ошибка в параллельной проверке: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
             
             finally:
                 # Гарантированно отмечаем завершение валидации
@@ -908,7 +907,7 @@ class YouTubeAPIValidator:
                 
                 except Exception as e:
                     logging.error(f"Ошибка при последовательной проверке ключей: {str(e)}")
-                    logging.debug(traceback.format_exc())
+                    logging.debug("Exception details:", exc_info=True)
                     result = False
                 
                 finally:
@@ -947,7 +946,7 @@ class YouTubeAPIValidator:
             
         except Exception as e:
             logging.error(f"Неожиданная ошибка при проверке ключей: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             
             # Пытаемся сохранить результаты даже в случае ошибки
             if self.valid_keys:
@@ -1090,7 +1089,7 @@ class YouTubeAPIValidator:
                 logging.info(f"Загружена база данных квот с информацией о {len(self.quota_database)} ключах.")
             except Exception as e:
                 logging.error(f"Ошибка загрузки базы данных квот: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 self.quota_database = {}
         else:
             logging.info("База данных квот не найдена. Будет создана новая.")
@@ -1104,7 +1103,7 @@ class YouTubeAPIValidator:
             logging.info(f"База данных квот сохранена в {self.quota_database_file}")
         except Exception as e:
             logging.error(f"Ошибка сохранения базы данных квот: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def get_used_quota(self, api_key):
         """
@@ -1254,7 +1253,7 @@ class YouTubeAPIValidator:
                 logging.info(f"Загружены данные аналитики API.")
             except Exception as e:
                 logging.error(f"Ошибка загрузки данных аналитики: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 
                 # Инициализируем данные аналитики, если их не удалось загрузить
                 self.analytics_data = {
@@ -1291,7 +1290,7 @@ class YouTubeAPIValidator:
             logging.info(f"Данные аналитики сохранены в {self.analytics_file}")
         except Exception as e:
             logging.error(f"Ошибка сохранения данных аналитики: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def _cleanup_old_analytics_data(self):
         """Очистить устаревшие данные аналитики (старше 30 дней)."""
@@ -1588,7 +1587,7 @@ class YouTubeAPIValidator:
             
         except Exception as e:
             logging.error(f"Ошибка при экспорте в CSV: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
     
     def import_from_csv(self, filename, append=True):
@@ -1641,7 +1640,7 @@ class YouTubeAPIValidator:
             
         except Exception as e:
             logging.error(f"Ошибка при импорте из CSV: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False, 0
 
 def validate_api_keys(api_file='api.txt', output_file='Good_API.txt', 
@@ -5,12 +5,13 @@ Contains reusable components for file operations, UI updates, and error handling
 
 import os
 import logging
-import traceback
 import json
-from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox, filedialog
 
+# Error entries go to debug.txt through the handler the GUI's setup_logging installs
+_debug_logger = logging.getLogger("youtube_scraper_gui.debug")
+
 class FileManager:
     """Manages file operations with consistent error handling."""
     
@@ -36,7 +37,7 @@ class FileManager:
             return content
         except Exception as e:
             logging.error(f"Error loading file {file_path}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return default_content
     
     @staticmethod
@@ -64,7 +65,7 @@ class FileManager:
             return lines
         except Exception as e:
             logging.error(f"Error loading lines from file {file_path}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return []
     
     @staticmethod
@@ -83,15 +84,15 @@ class FileManager:
         try:
             # Make sure the directory exists
             directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
                 
             with open(file_path, 'w', encoding=encoding) as f:
                 f.write(content)
             return True
         except Exception as e:
             logging.error(f"Error saving file {file_path}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
     
     @staticmethod
@@ -117,7 +118,7 @@ class FileManager:
                 return json.load(f)
         except Exception as e:
             logging.error(f"Error loading JSON from {file_path}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return default_value
     
     @staticmethod
@@ -139,7 +140,7 @@ class FileManager:
             return True
         except Exception as e:
             logging.error(f"Error saving JSON to {file_path}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
     
     @staticmethod
@@ -167,7 +168,7 @@ class FileManager:
             return file_path
         except Exception as e:
             logging.error(f"Error opening file dialog: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return None
     
     @staticmethod
@@ -197,15 +198,17 @@ class FileManager:
             return file_path
         except Exception as e:
             logging.error(f"Error opening save file dialog: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return None
     
     @staticmethod
     def ensure_directory(dir_path):
         """Create a directory if it doesn't exist."""
-        if not os.path.exists(dir_path):
+        try:
             os.makedirs(dir_path)
             logging.info(f"Created directory: {dir_path}")
+        except FileExistsError:
+            pass
 
 class UIHelper:
     """Helper class for common UI operations."""
@@ -316,16 +319,10 @@ class ErrorHandler:
         """
         logging.error(message)
         
-        try:
-            with open("debug.txt", "a", encoding="utf-8") as f:
-                f.write(f"=== {error_type} AT {datetime.now()} ===\n")
-                f.write(f"{message}\n")
-                if exception:
-                    f.write(f"Exception: {str(exception)}\n")
-                    f.write(traceback.format_exc())
-                f.write("\n\n")
-        except Exception as e:
-            logging.error(f"Failed to write to debug.txt: {e}")
+        if exception:
+            _debug_logger.error("=== %s ===\n%s\nException: %s", error_type, message, exception, exc_info=True)
+        else:
+            _debug_logger.error("=== %s ===\n%s", error_type, message)
     
     @staticmethod
     def handle_exception(func):
@@ -345,13 +342,8 @@ class ErrorHandler:
                 error_msg = f"Error in {func.__name__}: {str(e)}"
                 logging.error(error_msg)
                 
-                with open("debug.txt", "a", encoding="utf-8") as f:
-                    f.write(f"=== FUNCTION ERROR AT {datetime.now()} ===\n")
-                    f.write(f"Function: {func.__name__}\n")
-                    f.write(f"Args: {args}, Kwargs: {kwargs}\n")
-                    f.write(f"Error: {str(e)}\n")
-                    f.write(traceback.format_exc())
-                    f.write("\n\n")
+                _debug_logger.error("=== FUNCTION ERROR ===\nFunction: %s\nArgs: %s, Kwargs: %s\nError: %s",
+                                    func.__name__, args, kwargs, e, exc_info=True)
                 
                 # Show error to user
                 messagebox.showerror("Error", f"An error occurred: {str(e)}\nSee debug.txt for details.")
@@ -10,7 +10,6 @@ import io
 import codecs
 import locale
 import time
-import traceback
 import logging
 from datetime import datetime
 import tkinter as tk
@@ -149,7 +148,7 @@ def create_required_files():
         'proxy.txt': "# Format: ip:port:login:password\n",
         'settings.txt': ("min_subscribers=1000\nmax_subscribers=1000000\n"
                          "min_total_views=10000\ncreation_year_limit=2015\n"
-                         "delay_min=0.5\ndelay_max=2\nparse_mode=email\n"
+                         "parse_mode=email\n"
                          "max_workers=5\nbatch_size=50\nuse_caching=true\n"
                          "shorts_filter_mode=3\n"),
         'blacklist.txt': "IN\nBR\nPK\n",
@@ -277,10 +276,9 @@ def main():
         error_message = f"Ошибка запуска приложения: {str(e)}"
         logging.error(error_message)
         
-        with open("debug.txt", "a", encoding="utf-8") as f:
-            f.write(f"\n=== ОШИБКА ЗАПУСКА {datetime.now()} ===\n")
-            f.write(f"{error_message}\n")
-            f.write(traceback.format_exc() + "\n\n")
+        # Запись в debug.txt идёт через его обработчик логирования, а не через отдельный дескриптор
+        logging.getLogger("youtube_scraper_gui.debug").error(
+            "=== ОШИБКА ЗАПУСКА ===\n%s", error_message, exc_info=True)
         
         # Показываем ошибку в консоли
         print("Подробности смотрите в файле debug.txt")
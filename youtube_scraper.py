@@ -12,17 +12,59 @@ import random
 import requests
 import logging
 import datetime
-import traceback
 import uuid
-from collections import OrderedDict
+import sqlite3
+import mmap
+from collections import OrderedDict, Counter, deque
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed, Future
 from bs4 import BeautifulSoup
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 from advanced_email_finder import AdvancedEmailFinder
 from api_key_handler import integrate_api_key_handler
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Tag fragments that mark generic, low-value keywords
+_GENERIC_TAG_RE = re.compile(r'subscribe|channel|video|follow')
+# Preferred domains when picking one email out of a group of similar ones
+_POPULAR_EMAIL_DOMAINS = frozenset({'gmail.com', 'yahoo.com', 'hotmail.com'})
+# Gmail ignores dots and anything after '+' in the username
+_GMAIL_DOMAINS = frozenset({'gmail.com', 'googlemail.com'})
+_STRIP_DOT = str.maketrans('', '', '.')
+# Error entries for debug.txt; the GUI's setup_logging attaches the debug.txt handler
+_debug_logger = logging.getLogger("youtube_scraper_gui.debug")
+
+def _read_email_lines(path='emails.txt'):
+    """Read non-empty, non-comment lines of an email file with one bulk decode."""
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            text = buf[:].decode('utf-8', 'replace')
+    return _parse_email_lines(text)
+
+def _parse_email_lines(text):
+    """Split text into its non-empty, non-comment lines."""
+    return [email for email in (line.strip() for line in text.split('\n'))
+            if email and not email.startswith('#')]
+
+def _email_key(email):
+    """Key emails are deduplicated on, both in EmailStore and in emails.txt."""
+    return email.strip().lower()
+
+def _json_default(obj):
+    """Serialize keyword sets and queues as JSON arrays."""
+    if isinstance(obj, (set, frozenset, deque)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class LRUCache:
     """Limited size cache with Least Recently Used eviction policy."""
     def __init__(self, max_size=1000):
@@ -98,6 +140,157 @@ class PrioritizedThreadPoolExecutor(ThreadPoolExecutor):
         
         return future
 
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to rate-limit responses (AIMD)."""
+    def __init__(self, capacity, refill_rate, max_refill_rate=None, min_refill_rate=1.0, increase_step=1.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_refill_rate = max_refill_rate or refill_rate
+        self.min_refill_rate = min_refill_rate
+        self.increase_step = increase_step
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def acquire(self, tokens=1):
+        """Take tokens from the bucket, blocking only while not enough are available."""
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = (tokens - self.tokens) / self.refill_rate
+            time.sleep(wait_time)
+    
+    def on_success(self):
+        """Additive increase of the refill rate after a successful request."""
+        with self.lock:
+            self.refill_rate = min(self.max_refill_rate, self.refill_rate + self.increase_step)
+    
+    def on_throttle(self):
+        """Multiplicative decrease of the refill rate after a rate-limit response."""
+        with self.lock:
+            self._refill()
+            self.refill_rate = max(self.min_refill_rate, self.refill_rate * 0.5)
+            self.tokens = 0
+
+class EmailStore:
+    """SQLite-backed set of discovered emails, deduplicated on _email_key.
+    
+    emails.db is the source of truth and emails.txt mirrors it. The byte offset
+    of emails.txt that has been read into the database is kept in the meta table,
+    so opening the store only imports lines appended to the file since then.
+    The connection is opened on first use and may be closed and reopened.
+    """
+    def __init__(self, path='emails.db', txt_path='emails.txt'):
+        self.path = path
+        self.txt_path = txt_path
+        self.conn = None
+        self.lock = threading.Lock()  # One connection shared between worker threads
+        self.count = 0  # Row count kept in memory so len() never has to query
+    
+    def _connect(self):
+        """Return the open connection, opening it and importing new emails.txt lines first if needed."""
+        if self.conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS emails(norm TEXT PRIMARY KEY, raw TEXT NOT NULL)")
+                conn.execute("CREATE TABLE IF NOT EXISTS meta(k TEXT PRIMARY KEY, v INTEGER NOT NULL)")
+            self.conn = conn
+            self._sync()
+            self.count = conn.execute("SELECT COUNT(*) FROM emails").fetchone()[0]
+        return self.conn
+    
+    def _sync(self):
+        """Import the emails.txt lines past the stored offset; rebuild if the file shrank."""
+        row = self.conn.execute("SELECT v FROM meta WHERE k = 'txt_offset'").fetchone()
+        offset = row[0] if row else 0
+        try:
+            size = os.path.getsize(self.txt_path)
+        except OSError:
+            size = 0
+        if size == offset:
+            return
+        with self.conn:
+            if size < offset:
+                # The file was rewritten outside the scraper, so it is read in full
+                self.conn.execute("DELETE FROM emails")
+                offset = 0
+            data = b''
+            if size:
+                with open(self.txt_path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read(size - offset)
+                # A trailing partial line is left for the next sync
+                data = data[:data.rfind(b'\n') + 1]
+            self.conn.executemany("INSERT OR IGNORE INTO emails(norm, raw) VALUES (?, ?)",
+                                  ((_email_key(email), email) for email in _parse_email_lines(data.decode('utf-8', 'replace'))))
+            self._set_offset(offset + len(data))
+    
+    def _set_offset(self, offset):
+        self.conn.execute("INSERT OR REPLACE INTO meta(k, v) VALUES ('txt_offset', ?)", (offset,))
+    
+    def add_many(self, emails):
+        """Insert emails in one transaction, append the new ones to emails.txt and return them."""
+        added = []
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                for email in emails:
+                    cursor = conn.execute("INSERT OR IGNORE INTO emails(norm, raw) VALUES (?, ?)",
+                                          (_email_key(email), email))
+                    if cursor.rowcount:
+                        added.append(email)
+                if added:
+                    with open(self.txt_path, 'a', encoding='utf-8') as f:
+                        f.write(''.join(f"{email}\n" for email in added))
+                    self._set_offset(os.path.getsize(self.txt_path))
+            self.count += len(added)
+        return added
+    
+    def remove_many(self, keys):
+        """Delete the rows stored under the given _email_key values."""
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.executemany("DELETE FROM emails WHERE norm = ?", ((key,) for key in keys))
+            self.count -= cursor.rowcount
+    
+    def mark_synced(self):
+        """Record that emails.txt was rewritten from the store and holds nothing new."""
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                self._set_offset(os.path.getsize(self.txt_path))
+    
+    def domain_counts(self):
+        """Return (domain, count) pairs, most frequent first."""
+        with self.lock:
+            return self._connect().execute(
+                "SELECT substr(norm, instr(norm, '@') + 1) AS d, COUNT(*) AS c "
+                "FROM emails GROUP BY d ORDER BY c DESC"
+            ).fetchall()
+    
+    def open(self):
+        with self.lock:
+            self._connect()
+    
+    def __len__(self):
+        return self.count
+    
+    def close(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
 class YouTubeChannelScraper:
     def __init__(self):
         self.settings = {}
@@ -107,12 +300,13 @@ class YouTubeChannelScraper:
         self.api_keys = []
         self.current_api_key_index = 0
         self.parsed_channels = set()
-        self.parsed_emails = set()
+        self.parsed_emails = EmailStore('emails.db', 'emails.txt')  # Connection opened on first use
         self.parsed_social_media = set()
         self.required_files = ['keywords.txt', 'proxy.txt', 'settings.txt', 'blacklist.txt', 'api.txt']
         self.api_usage_count = {}      # Track usage of each API key
         self.api_last_used = {}        # Track when each key was last used
         self.api_errors = {}           # Track errors per API key
+        self.api_quota_used = False    # Set once any key has been used, read by the GUI
         self.batch_size = 50           # Default batch size for group requests
         
         # Caches with size limits
@@ -122,15 +316,26 @@ class YouTubeChannelScraper:
         self.search_cache = LRUCache(max_size=100)
         
         self.max_workers = 5          # Default maximum number of worker threads
-        self.all_keywords = []
+        self.all_keywords = deque()    # FIFO queue of keywords to process
+        self.queued_keywords = set()   # Keywords currently in all_keywords
         self.processed_keywords = set()
         self.stop_requested = False
         self.min_api_cooldown = 2      # Minimum seconds between API key usages
         
+        # Client-side pacing of quota units per API key
+        self.api_rate_limiters = {}    # {api_key: TokenBucket}
+        self.rate_limiter_lock = threading.Lock()
+        self.rate_limit_capacity = 500       # Burst size in quota units
+        self.rate_limit_refill = 100.0       # Initial refill rate in quota units per second
+        self.rate_limit_max_refill = 400.0   # Upper bound for the adaptive refill rate
+        self.throttle_event = threading.Event()  # Set when any key gets a rate-limit response
+        self.progress_lock = threading.Lock()  # save_progress runs from both the GUI and the scraper thread
+        
         # For email similarity detection
         self.email_fingerprints = {}   # For storing normalized forms of emails
         self.similarity_threshold = 0.85  # Similarity threshold (0.0 to 1.0)
         self.email_domains = {}        # Track email domains for statistics
+        self.email_stats_dirty = True  # Set when the stored emails change
         
         # Daily quota tracking
         self.daily_quota_usage = {}    # Track {api_key: quota_used_today}
@@ -225,11 +430,12 @@ class YouTubeChannelScraper:
                             value = value.strip()
                             
                             if key in ['min_subscribers', 'max_subscribers', 'min_total_views', 'max_workers', 
-                                      'batch_size', 'email_finder_max_depth']:
+                                      'batch_size', 'email_finder_max_depth', 'rate_limit_capacity']:
                                 self.settings[key] = int(value)
                             elif key == 'creation_year_limit':
                                 self.settings[key] = int(value)
-                            elif key in ['delay_min', 'delay_max', 'min_api_cooldown', 'similarity_threshold']:
+                            elif key in ['min_api_cooldown', 'similarity_threshold',
+                                        'rate_limit_refill', 'rate_limit_max_refill']:
                                 self.settings[key] = float(value)
                             elif key in ['use_caching', 'filter_similar_emails', 'use_advanced_email_finder', 
                                         'email_finder_dns_check', 'email_finder_ai_heuristics']:
@@ -244,6 +450,9 @@ class YouTubeChannelScraper:
             self.batch_size = self.settings.get('batch_size', 50)
             self.min_api_cooldown = self.settings.get('min_api_cooldown', 2.0)
             self.similarity_threshold = self.settings.get('similarity_threshold', 0.85)
+            self.rate_limit_capacity = self.settings.get('rate_limit_capacity', 500)
+            self.rate_limit_refill = self.settings.get('rate_limit_refill', 100.0)
+            self.rate_limit_max_refill = self.settings.get('rate_limit_max_refill', 400.0)
             
             # Initialize AdvancedEmailFinder if enabled
             if self.settings.get('use_advanced_email_finder', False):
@@ -264,7 +473,7 @@ class YouTubeChannelScraper:
             logging.info(f"Settings loaded: {self.settings}")
         except Exception as e:
             logging.error(f"Error loading settings: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             logging.info("Creating default settings...")
             self._create_default_settings()
     
@@ -275,8 +484,6 @@ class YouTubeChannelScraper:
             'max_subscribers': 1000000,
             'min_total_views': 10000,
             'creation_year_limit': 2015,
-            'delay_min': 0.5,
-            'delay_max': 2,
             'parse_mode': 'email',
             'max_workers': 5,
             'batch_size': 50,
@@ -303,7 +510,7 @@ class YouTubeChannelScraper:
             logging.info("Created settings.txt with default settings.")
         except Exception as e:
             logging.error(f"Failed to create default settings file: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def load_existing_data(self):
         """Load existing data to avoid duplicates with improved error handling."""
@@ -332,16 +539,11 @@ class YouTubeChannelScraper:
     
     def _load_existing_emails(self):
         """Load existing email data."""
-        if os.path.exists('emails.txt'):
-            try:
-                with open('emails.txt', 'r', encoding='utf-8') as f:
-                    for line in f:
-                        email = line.strip()
-                        if email and not email.startswith('#'):
-                            self.parsed_emails.add(email)
-                logging.info(f"Loaded {len(self.parsed_emails)} existing emails.")
-            except Exception as e:
-                self._log_error("EMAIL LOAD ERROR", f"Error loading existing emails: {e}")
+        try:
+            self.parsed_emails.open()
+            logging.info(f"Loaded {len(self.parsed_emails)} existing emails.")
+        except Exception as e:
+            self._log_error("EMAIL LOAD ERROR", f"Error loading existing emails: {e}")
     
     def _load_existing_social_media(self):
         """Load existing social media data."""
@@ -360,14 +562,8 @@ class YouTubeChannelScraper:
     def _log_error(self, error_type, message):
         """Log an error to both the logging system and debug.txt."""
         logging.error(message)
-        
-        try:
-            with open("debug.txt", "a", encoding="utf-8") as f:
-                f.write(f"=== {error_type} AT {datetime.datetime.now()} ===\n")
-                f.write(f"{message}\n")
-                f.write(traceback.format_exc() + "\n\n")
-        except Exception as e:
-            logging.error(f"Failed to write to debug.txt: {e}")
+        # Through the GUI's debug.txt handler when it is installed, so the file has a single writer
+        _debug_logger.error("=== %s ===\n%s", error_type, message, exc_info=True)
     
     def load_keywords(self):
         """Load keywords from keywords.txt file with improved error recovery."""
@@ -547,14 +743,50 @@ class YouTubeChannelScraper:
         
         # Track usage
         self.api_usage_count[api_key] = self.api_usage_count.get(api_key, 0) + 1
+        self.api_quota_used = True
         self.daily_quota_usage[api_key] = self.daily_quota_usage.get(api_key, 0) + units_used
         
         # Log if approaching quota limit
         if self.daily_quota_usage[api_key] > self.daily_quota_limit * 0.9:
             logging.warning(f"API key {api_key[:4]}...{api_key[-4:]} is approaching daily quota limit")
-            
+        
+        # Pace requests per key; blocks only when the key's bucket is out of tokens
+        self._get_rate_limiter(api_key).acquire(units_used)
+        
         return self.daily_quota_usage[api_key]
     
+    def _get_rate_limiter(self, api_key):
+        """Get (or lazily create) the token bucket pacing requests for an API key."""
+        with self.rate_limiter_lock:
+            bucket = self.api_rate_limiters.get(api_key)
+            if bucket is None:
+                bucket = TokenBucket(
+                    capacity=self.rate_limit_capacity,
+                    refill_rate=self.rate_limit_refill,
+                    max_refill_rate=self.rate_limit_max_refill,
+                    increase_step=self.rate_limit_refill * 0.05
+                )
+                self.api_rate_limiters[api_key] = bucket
+            return bucket
+    
+    def _throttle_api_key(self, api_key, units_used):
+        """Slow down an API key after a rate-limit response and wait until it may be retried."""
+        bucket = self._get_rate_limiter(api_key)
+        bucket.on_throttle()
+        self.throttle_event.set()
+        bucket.acquire(units_used)
+    
+    def wait_if_needed(self):
+        """Pause briefly between keywords, but only after a rate-limit response.
+        
+        The token buckets already pace API calls and page scraping backs off on
+        its own errors, so no fixed delay is needed; a small jitter keeps keys
+        and page fetches from retrying in lockstep after a 429/403.
+        """
+        if self.throttle_event.is_set():
+            self.throttle_event.clear()
+            time.sleep(random.uniform(0, 0.1))
+    
     def get_next_api_key(self):
         """Get the next API key with improved selection based on errors, quota, and cooldown."""
         if not self.api_keys:
@@ -777,31 +1009,12 @@ class YouTubeChannelScraper:
                 
             except Exception as e:
                 logging.error(f"Unexpected error creating YouTube service: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 raise e
         
         # If we reach here, we've exceeded our retry attempts
         raise Exception(f"Failed to create YouTube service after {max_retries} retries")
     
-    def random_delay(self):
-        """Wait for a random delay with jitter to avoid detection patterns."""
-        min_delay = self.settings.get('delay_min', 0.5)
-        max_delay = self.settings.get('delay_max', 2)
-        
-        # Add jitter to make delays less predictable
-        base_delay = random.uniform(min_delay, max_delay)
-        jitter = random.uniform(-0.1, 0.1) * base_delay  # ±10% jitter
-        
-        delay = max(0.1, base_delay + jitter)  # Ensure minimum delay of 0.1s
-        
-        # Occasionally add a slightly longer delay to mimic human behavior
-        if random.random() < 0.1:  # 10% chance
-            delay += random.uniform(1.0, 2.0)
-            logging.debug(f"Adding extra delay: {delay:.2f}s")
-            
-        logging.debug(f"Waiting for {delay:.2f}s")
-        time.sleep(delay)
-    
     def search_youtube_videos(self, keyword, max_results=100):
         """Search for YouTube videos with optimized API usage and pagination."""
         logging.info(f"Searching for videos with keyword: {keyword}")
@@ -858,6 +1071,7 @@ class YouTubeChannelScraper:
                 while retry_count < max_retries:
                     try:
                         search_response = search_request.execute()
+                        self._get_rate_limiter(api_key).on_success()
                         
                         videos_page = []
                         for item in search_response.get('items', []):
@@ -881,10 +1095,6 @@ class YouTubeChannelScraper:
                         
                         logging.info(f"Found {len(videos_page)} videos for keyword: {keyword} on page {page_index+1}")
                         
-                        # Add a small delay between page requests
-                        if page_index < 2:  # Don't delay after the last page
-                            time.sleep(0.5)
-                        
                         break  # Success, exit retry loop
                         
                     except HttpError as e:
@@ -893,9 +1103,8 @@ class YouTubeChannelScraper:
                         error_code = getattr(e, 'status_code', 0)
                         
                         if error_code in [403, 429]:  # Rate limiting
-                            delay = 2 ** retry_count + random.uniform(0, 1)
-                            logging.warning(f"Rate limit hit during search. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
-                            time.sleep(delay)
+                            logging.warning(f"Rate limit hit during search. Slowing down key and retrying ({retry_count}/{max_retries})")
+                            self._throttle_api_key(api_key, units_used=100)
                         elif error_code >= 500:  # Server errors
                             delay = 2 ** retry_count + random.uniform(0, 1)
                             logging.warning(f"Server error: {error_code}. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
@@ -958,7 +1167,7 @@ class YouTubeChannelScraper:
             
         except Exception as e:
             logging.error(f"Unexpected error searching for videos: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return []
     
     def get_video_tags_batch(self, video_ids, min_views=1000):
@@ -1010,6 +1219,7 @@ class YouTubeChannelScraper:
                             id=id_str,
                             fields='items(id,snippet/tags,statistics/viewCount)'  # Only request fields we need
                         ).execute()
+                        self._get_rate_limiter(api_key).on_success()
                         
                         for item in video_response.get('items', []):
                             video_id = item['id']
@@ -1035,9 +1245,8 @@ class YouTubeChannelScraper:
                         error_code = getattr(e, 'status_code', 0)
                         
                         if error_code in [403, 429]:  # Rate limiting
-                            delay = 2 ** retry_count + random.uniform(0, 1)
-                            logging.warning(f"Rate limit hit during video tag fetch. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
-                            time.sleep(delay)
+                            logging.warning(f"Rate limit hit during video tag fetch. Slowing down key and retrying ({retry_count}/{max_retries})")
+                            self._throttle_api_key(api_key, units_used=len(batch_ids))
                         elif error_code >= 500:  # Server errors
                             delay = 2 ** retry_count + random.uniform(0, 1)
                             logging.warning(f"Server error: {error_code}. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
@@ -1045,10 +1254,6 @@ class YouTubeChannelScraper:
                         else:
                             logging.error(f"Error getting video tags: {e}")
                             break
-                
-                # Add a delay between batches to avoid rate limiting
-                if i + batch_size < len(uncached_video_ids):
-                    time.sleep(0.5)
             
             # Merge cached results with new results
             for vid in video_ids:
@@ -1064,7 +1269,7 @@ class YouTubeChannelScraper:
             
         except Exception as e:
             logging.error(f"Unexpected error getting video tags in batch: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             
             # Return cached results for any videos we have
             cached_results = {}
@@ -1171,6 +1376,7 @@ class YouTubeChannelScraper:
                             id=id_str,
                             fields='items(id,snippet/title,snippet/description,snippet/publishedAt,snippet/country,statistics/subscriberCount,statistics/viewCount,statistics/videoCount)'
                         ).execute()
+                        self._get_rate_limiter(api_key).on_success()
                         
                         for channel_info in channel_response.get('items', []):
                             channel_id = channel_info['id']
@@ -1227,9 +1433,8 @@ class YouTubeChannelScraper:
                         error_code = getattr(e, 'status_code', 0)
                         
                         if error_code in [403, 429]:  # Rate limiting
-                            delay = 2 ** retry_count + random.uniform(0, 1)
-                            logging.warning(f"Rate limit hit during channel info fetch. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
-                            time.sleep(delay)
+                            logging.warning(f"Rate limit hit during channel info fetch. Slowing down key and retrying ({retry_count}/{max_retries})")
+                            self._throttle_api_key(api_key, units_used=len(batch_ids))
                         elif error_code >= 500:  # Server errors
                             delay = 2 ** retry_count + random.uniform(0, 1)
                             logging.warning(f"Server error: {error_code}. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
@@ -1237,10 +1442,6 @@ class YouTubeChannelScraper:
                         else:
                             logging.error(f"Error getting channel info: {e}")
                             break
-                
-                # Add a delay between batches to avoid rate limiting
-                if i + batch_size < len(uncached_ids):
-                    time.sleep(0.5)
             
             # Add any cached channels to results
             for cid in unique_ids:
@@ -1253,7 +1454,7 @@ class YouTubeChannelScraper:
             
         except Exception as e:
             logging.error(f"Unexpected error getting channels info in batch: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             
             # Return any cached results we have
             cached_results = {}
@@ -1351,6 +1552,8 @@ class YouTubeChannelScraper:
             except requests.exceptions.RequestException as e:
                 retry_count += 1
                 delay = base_delay * (2 ** retry_count) + random.uniform(0, 1)
+                if getattr(e.response, 'status_code', None) == 429:
+                    self.throttle_event.set()  # Also jitter before the next keyword
                 
                 if isinstance(e, requests.exceptions.Timeout):
                     logging.warning(f"Timeout when scraping channel {channel_id} about page. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
@@ -1367,7 +1570,7 @@ class YouTubeChannelScraper:
             
             except Exception as e:
                 logging.error(f"Unexpected error scraping channel about page: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 about_content = None
                 break
         
@@ -1422,6 +1625,8 @@ class YouTubeChannelScraper:
             except requests.exceptions.RequestException as e:
                 retry_count += 1
                 delay = base_delay * (2 ** retry_count) + random.uniform(0, 1)
+                if getattr(e.response, 'status_code', None) == 429:
+                    self.throttle_event.set()  # Also jitter before the next keyword
                 
                 if isinstance(e, requests.exceptions.Timeout):
                     logging.warning(f"Timeout when scraping channel {channel_id} homepage. Retrying in {delay:.2f}s ({retry_count}/{max_retries})")
@@ -1438,7 +1643,7 @@ class YouTubeChannelScraper:
             
             except Exception as e:
                 logging.error(f"Unexpected error scraping channel homepage: {str(e)}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 home_content = None
                 break
         
@@ -1465,7 +1670,7 @@ class YouTubeChannelScraper:
                         pass
             except Exception as e:
                 logging.error(f"Error parsing about page HTML: {e}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
         
         if home_content:
             try:
@@ -1488,7 +1693,7 @@ class YouTubeChannelScraper:
                         pass
             except Exception as e:
                 logging.error(f"Error parsing homepage HTML: {e}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
         
         # Combine texts from both pages
         combined_text = about_text + "\n\n" + home_text
@@ -1667,18 +1872,15 @@ class YouTubeChannelScraper:
                 
         except Exception as e:
             logging.error(f"Error parsing contacts for channel {channel_info.get('id', 'unknown')}: {str(e)}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def _filter_similar_emails(self, emails):
         """Filter out similar emails based on Levenshtein distance."""
         if not emails or len(emails) <= 1:
             return emails
             
-        # Normalize emails
-        normalized_emails = {}
-        for email in emails:
-            normalized = self.normalize_email(email)
-            normalized_emails[email] = normalized
+        # Normalize emails and split them into (username, domain) once
+        split_norm = {email: self.split_normalized_email(email) for email in emails}
         
         # Group by similarity
         unique_emails = []
@@ -1695,8 +1897,8 @@ class YouTubeChannelScraper:
             for other_email in emails:
                 if other_email != email and other_email not in used_emails:
                     similarity = self.calculate_email_similarity(
-                        normalized_emails[email],
-                        normalized_emails[other_email]
+                        split_norm[email],
+                        split_norm[other_email]
                     )
                     
                     if similarity >= self.similarity_threshold:
@@ -1705,42 +1907,39 @@ class YouTubeChannelScraper:
             
             # Choose the best email from the group (shortest, most common domain, or first)
             if len(similar_group) > 1:
-                # Sort by domain popularity and length
-                best_email = min(similar_group, key=lambda e: (
-                    e.split('@')[-1] not in self.common_domains,  # Prefer common domains
-                    len(e),  # Prefer shorter emails
-                    e  # Lexicographic order as tiebreaker
-                ))
-                unique_emails.append(best_email)
+                unique_emails.append(self._select_best_email(similar_group))
             else:
                 unique_emails.append(email)
         
         return unique_emails
     
+    def _select_best_email(self, group):
+        """Choose the best email from a group of similar ones.
+        
+        Prefers popular domains, then shorter addresses, then lexicographic order.
+        Keys are built once per email instead of on every comparison.
+        """
+        keyed = [(email.rsplit('@', 1)[-1] not in _POPULAR_EMAIL_DOMAINS, len(email), email)
+                 for email in group]
+        return min(keyed)[2]
+    
     def _save_emails(self, emails, channel_title, channel_id):
         """Save discovered emails to files."""
         try:
-            with open('emails.txt', 'a', encoding='utf-8') as f:
-                for email in emails:
-                    # Skip email if it's already in the parsed_emails set
-                    if email not in self.parsed_emails:
-                        self.parsed_emails.add(email)
-                        # Save only the email address, one per line
-                        f.write(f"{email}\n")
-                        logging.info(f"Found email: {email} for channel: {channel_title}")
-                        
-                        # Track email domains for statistics
-                        domain = email.split('@')[-1]
-                        self.email_domains[domain] = self.email_domains.get(domain, 0) + 1
+            # The store skips emails it already holds and appends only new ones to emails.txt
+            new_emails = self.parsed_emails.add_many(emails)
+            if new_emails:
+                self.email_stats_dirty = True
+                for email in new_emails:
+                    logging.info(f"Found email: {email} for channel: {channel_title}")
             
             # Save detailed email info to a separate file for reference
             with open('emails_detailed.txt', 'a', encoding='utf-8') as f:
                 for email in emails:
-                    if email in self.parsed_emails:
-                        f.write(f"{email},{channel_title},{channel_id}\n")
+                    f.write(f"{email},{channel_title},{channel_id}\n")
         except Exception as e:
             logging.error(f"Error saving emails: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def _save_social_media(self, social_links, channel_title, channel_id):
         """Save discovered social media links to file."""
@@ -1753,7 +1952,7 @@ class YouTubeChannelScraper:
                         logging.info(f"Found social link: {link} for channel: {channel_title}")
         except Exception as e:
             logging.error(f"Error saving social media links: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def save_channel(self, channel_info):
         """Save channel information to file with error handling."""
@@ -1774,7 +1973,7 @@ class YouTubeChannelScraper:
             logging.info(f"Saved channel: {channel_info['title']} ({channel_id})")
         except Exception as e:
             logging.error(f"Error saving channel {channel_id}: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
     
     def process_search_results(self, keyword):
         """Process search results with improved structure and error handling."""
@@ -1859,7 +2058,7 @@ class YouTubeChannelScraper:
                             
                     except Exception as e:
                         logging.error(f"Error in thread for parsing contacts: {e}")
-                        logging.debug(traceback.format_exc())
+                        logging.debug("Exception details:", exc_info=True)
         else:
             # For just one channel, process directly
             for channel_info in channels_info.values():
@@ -1892,14 +2091,14 @@ class YouTubeChannelScraper:
             if len(new_keywords) > 20:
                 new_keywords = set(random.sample(list(new_keywords), 20))
                 
-            # Save discovered keywords
+            # Save discovered keywords in a single write
             try:
-                with open('keywords_discovered.txt', 'a', encoding='utf-8') as f:
-                    for keyword in new_keywords:
-                        f.write(f"{keyword}\n")
+                if new_keywords:
+                    with open('keywords_discovered.txt', 'a', encoding='utf-8', buffering=65536) as f:
+                        f.write('\n'.join(new_keywords) + '\n')
             except Exception as e:
                 logging.error(f"Error saving discovered keywords: {e}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
             
             return list(new_keywords)
         else:
@@ -1922,70 +2121,80 @@ class YouTubeChannelScraper:
         sampled_channels = random.sample(channel_ids, sample_size)
         
         try:
-            for channel_id in sampled_channels:
-                if self.stop_requested:
-                    return []
-                    
-                # Track API usage - search operation costs 100 units
-                self.track_api_usage(api_key, units_used=100)
-                    
-                try:
-                    # Search for videos from this channel
-                    channel_videos_request = service.search().list(
-                        part='id',
-                        channelId=channel_id,
-                        maxResults=max_results_per_channel,
-                        type='video',
-                        order='viewCount',  # Get most viewed videos
-                        fields='items(id/videoId)'
-                    )
-                    
-                    response = channel_videos_request.execute()
-                    
-                    for item in response.get('items', []):
-                        if 'videoId' in item.get('id', {}):
-                            video_ids.append(item['id']['videoId'])
-                            
-                    # Add a small delay between requests
-                    time.sleep(0.5)
-                    
-                except HttpError as e:
-                    logging.warning(f"Error getting videos for channel {channel_id}: {e}")
-                    continue
+            # Channel searches are independent I/O-bound requests, run them concurrently
+            with ThreadPoolExecutor(max_workers=sample_size) as executor:
+                futures = {
+                    executor.submit(self._search_channel_videos, channel_id, service, api_key, max_results_per_channel): channel_id
+                    for channel_id in sampled_channels
+                }
+                
+                for future in as_completed(futures):
+                    video_ids.extend(future.result())
             
-            return video_ids
+            if self.stop_requested:
+                return []
             
+            return video_ids
+        
         except Exception as e:
             logging.error(f"Error getting channel videos: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return []
+    
+    def _search_channel_videos(self, channel_id, service, api_key, max_results):
+        """Search the most viewed videos of a single channel."""
+        if self.stop_requested:
+            return []
+        
+        # Track API usage - search operation costs 100 units
+        self.track_api_usage(api_key, units_used=100)
+        
+        try:
+            # Search for videos from this channel
+            channel_videos_request = service.search().list(
+                part='id',
+                channelId=channel_id,
+                maxResults=max_results,
+                type='video',
+                order='viewCount',  # Get most viewed videos
+                fields='items(id/videoId)'
+            )
             
+            # httplib2 is not thread-safe, so each worker executes on its own connection
+            response = channel_videos_request.execute(http=build_http())
+            self._get_rate_limiter(api_key).on_success()
+            
+            return [item['id']['videoId'] for item in response.get('items', [])
+                    if 'videoId' in item.get('id', {})]
+        
+        except HttpError as e:
+            if getattr(e, 'status_code', 0) in [403, 429]:
+                self._get_rate_limiter(api_key).on_throttle()
+                self.throttle_event.set()
+            logging.warning(f"Error getting videos for channel {channel_id}: {e}")
+            return []
+    
     def _extract_keywords_from_tags(self, video_tags_dict):
         """Extract valuable keywords from video tags with popularity analysis."""
         if not video_tags_dict:
             return set()
             
-        # Count occurrences of each tag
-        tag_counts = {}
-        for video_id, tags in video_tags_dict.items():
-            for tag in tags:
-                tag_lower = tag.lower()
-                tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
+        # Count occurrences of each tag, lowercased once here
+        tag_counts = Counter(tag.lower() for tags in video_tags_dict.values() for tag in tags)
         
         # Filter tags that appear in multiple videos
-        popular_tags = {tag for tag, count in tag_counts.items() if count > 1}
+        popular_tags = [tag for tag, count in tag_counts.items() if count > 1]
         
         # Process tags to get high-quality keywords
         keywords = set()
         for tag in popular_tags:
-            # Keep only tags with reasonable length and word count
-            words = tag.split()
-            word_count = len(words)
+            # Keep only tags with reasonable length and word count (length first, it is cheaper)
+            if not 3 <= len(tag) <= 30 or not 1 <= len(tag.split()) <= 3:
+                continue
             
-            if 1 <= word_count <= 3 and 3 <= len(tag) <= 30:
-                # Skip tags that are just numbers or very generic
-                if not tag.isdigit() and not any(generic in tag.lower() for generic in ['subscribe', 'channel', 'video', 'follow']):
-                    keywords.add(tag)
+            # Skip tags that are just numbers or very generic
+            if not tag.isdigit() and not _GENERIC_TAG_RE.search(tag):
+                keywords.add(tag)
         
         logging.info(f"Extracted {len(keywords)} quality keywords from {len(video_tags_dict)} videos")
         return keywords
@@ -2003,12 +2212,13 @@ class YouTubeChannelScraper:
             self.email_domains[domain] = self.email_domains.get(domain, 0) + 1
             
             # Gmail-specific normalization (remove dots, ignore everything after +)
-            if domain in ['gmail.com', 'googlemail.com']:
-                # Remove dots from username
-                username = username.replace('.', '')
+            if domain in _GMAIL_DOMAINS:
                 # Remove everything after + in username
-                if '+' in username:
-                    username = username.split('+', 1)[0]
+                plus = username.find('+')
+                if plus >= 0:
+                    username = username[:plus]
+                # Remove dots from username
+                username = username.translate(_STRIP_DOT)
                 # Normalize googlemail to gmail
                 domain = 'gmail.com'
             
@@ -2029,19 +2239,24 @@ class YouTubeChannelScraper:
             logging.debug(f"Error normalizing email {email}: {e}")
             return email
             
+    def split_normalized_email(self, email):
+        """Normalize an email and split it into a (username, domain) tuple."""
+        username, _, domain = self.normalize_email(email).lower().partition('@')
+        return username, domain
+    
     def calculate_email_similarity(self, email1, email2):
-        """Calculate similarity between two email addresses."""
+        """Calculate similarity between two (username, domain) tuples from split_normalized_email."""
         if email1 == email2:
             return 1.0
         
-        if '@' not in email1 or '@' not in email2:
+        username1, domain1 = email1
+        username2, domain2 = email2
+        
+        # Addresses without '@' have an empty domain
+        if not domain1 or not domain2:
             return 0.0
         
-        # Split into username and domain
         try:
-            username1, domain1 = email1.lower().split('@', 1)
-            username2, domain2 = email2.lower().split('@', 1)
-            
             # If domains don't match, they're different emails
             if domain1 != domain2:
                 return 0.0
@@ -2051,12 +2266,17 @@ class YouTubeChannelScraper:
             if len(username1) <= 3 or len(username2) <= 3:
                 return 1.0 if username1 == username2 else 0.0
                 
-            # Levenshtein distance ratio for longer usernames
-            similarity = self._levenshtein_ratio(username1, username2)
-            
             # Check if one username is a prefix of the other
+            prefix_bonus = 0.0
             if username1.startswith(username2) or username2.startswith(username1):
                 prefix_bonus = 0.15  # Boost similarity for prefix matches
+            
+            # Levenshtein distance ratio for longer usernames; pairs that cannot
+            # reach the threshold even with the bonus skip the full computation
+            similarity = self._levenshtein_ratio(
+                username1, username2, score_cutoff=self.similarity_threshold - prefix_bonus
+            )
+            if prefix_bonus:
                 similarity = min(1.0, similarity + prefix_bonus)
                 
             return similarity
@@ -2064,11 +2284,20 @@ class YouTubeChannelScraper:
             # If any errors in calculation, treat as different emails
             return 0.0
             
-    def _levenshtein_ratio(self, s1, s2):
-        """Calculate normalized Levenshtein distance between two strings."""
+    def _levenshtein_ratio(self, s1, s2, score_cutoff=0.0):
+        """Calculate normalized Levenshtein distance between two strings.
+        
+        Returns 0.0 without running the DP when the length difference alone
+        keeps the ratio below score_cutoff.
+        """
         if s1 == s2:
             return 1.0
         
+        # The distance is at least the length difference, which bounds the ratio
+        len_a, len_b = len(s1), len(s2)
+        if 1.0 - abs(len_a - len_b) / max(len_a, len_b, 1) < score_cutoff:
+            return 0.0
+        
         # Calculate Levenshtein distance
         if len(s1) < len(s2):
             s1, s2 = s2, s1
@@ -2102,100 +2331,121 @@ class YouTubeChannelScraper:
         """Remove duplicate emails from emails.txt and update statistics."""
         try:
             if os.path.exists('emails.txt'):
-                # Read all emails from the file
-                emails = []
-                with open('emails.txt', 'r', encoding='utf-8') as f:
-                    for line in f:
-                        email = line.strip()
-                        if email and not email.startswith('#'):
-                            emails.append(email)
+                if not self.settings.get('filter_similar_emails', True):
+                    # Simple duplicate removal streams the file, so only the seen set is kept in memory
+                    unique_emails = self._remove_exact_email_duplicates()
+                    if unique_emails is None:
+                        logging.info("No emails to process for duplicate removal.")
+                        return
+                    self.save_email_stats()
+                    return
+                
+                # Similarity filtering compares every pair, so it needs the full list;
+                # the store imports pending lines first so the rewrite below loses none
+                self.parsed_emails.open()
+                emails = _read_email_lines('emails.txt')
                 
                 if not emails:
                     logging.info("No emails to process for duplicate removal.")
                     return
                 
-                # Apply similarity-based filtering if enabled
-                if self.settings.get('filter_similar_emails', True):
-                    # First normalize all emails
-                    normalized_emails = {}
-                    for email in emails:
-                        normalized_emails[email] = self.normalize_email(email)
-                    
-                    # Group similar emails
-                    email_groups = []
-                    processed = set()
-                    
-                    for email in emails:
-                        if email in processed:
-                            continue
-                            
-                        group = [email]
-                        processed.add(email)
-                        
-                        # Find similar emails
-                        for other in emails:
-                            if other != email and other not in processed:
-                                similarity = self.calculate_email_similarity(
-                                    normalized_emails[email],
-                                    normalized_emails[other]
-                                )
-                                
-                                if similarity >= self.similarity_threshold:
-                                    group.append(other)
-                                    processed.add(other)
+                # First normalize all emails and split them into (username, domain) once
+                split_norm = {email: self.split_normalized_email(email) for email in emails}
+                
+                # Group similar emails
+                email_groups = []
+                processed = set()
+                
+                for email in emails:
+                    if email in processed:
+                        continue
                         
-                        email_groups.append(group)
+                    group = [email]
+                    processed.add(email)
                     
-                    # Select best email from each group
-                    best_emails = []
-                    for group in email_groups:
-                        if len(group) == 1:
-                            best_emails.append(group[0])
-                        else:
-                            # Choose the best email (common domain, shorter, etc.)
-                            best_email = min(group, key=lambda e: (
-                                e.split('@')[-1] not in ['gmail.com', 'yahoo.com', 'hotmail.com'],
-                                len(e),
-                                e
-                            ))
-                            best_emails.append(best_email)
-                    
-                    unique_emails = best_emails
-                    logging.info(f"Removed {len(emails) - len(unique_emails)} similar/duplicate emails.")
-                else:
-                    # Simple duplicate removal
-                    unique_emails = []
-                    seen = set()
-                    for email in emails:
-                        if email not in seen:
-                            seen.add(email)
-                            unique_emails.append(email)
+                    # Find similar emails
+                    for other in emails:
+                        if other != email and other not in processed:
+                            similarity = self.calculate_email_similarity(
+                                split_norm[email],
+                                split_norm[other]
+                            )
+                            
+                            if similarity >= self.similarity_threshold:
+                                group.append(other)
+                                processed.add(other)
                     
-                    logging.info(f"Removed {len(emails) - len(unique_emails)} duplicate emails.")
+                    email_groups.append(group)
                 
-                # Write unique emails back to the file
-                with open('emails.txt', 'w', encoding='utf-8') as f:
-                    for email in unique_emails:
-                        f.write(f"{email}\n")
+                # Select best email from each group
+                best_emails = []
+                for group in email_groups:
+                    if len(group) == 1:
+                        best_emails.append(group[0])
+                    else:
+                        best_emails.append(self._select_best_email(group))
                 
-                # Update the parsed_emails set
-                self.parsed_emails = set(unique_emails)
+                unique_emails = best_emails
+                logging.info(f"Removed {len(emails) - len(unique_emails)} similar/duplicate emails.")
                 
-                # Update domain statistics
-                self.email_domains = {}
-                for email in unique_emails:
-                    try:
-                        domain = email.split('@')[-1]
-                        self.email_domains[domain] = self.email_domains.get(domain, 0) + 1
-                    except:
-                        pass
+                # Write unique emails back to the file in a single write
+                with open('emails.txt', 'w', encoding='utf-8', buffering=65536) as f:
+                    f.write(''.join(f"{email}\n" for email in unique_emails))
                 
-                # Save updated domain statistics
+                # Drop only the filtered-out emails from the store, unless a kept email shares their key
+                removed = {_email_key(email) for email in emails}.difference(map(_email_key, unique_emails))
+                if removed:
+                    self.parsed_emails.remove_many(removed)
+                    self.email_stats_dirty = True
+                self.parsed_emails.mark_synced()
                 self.save_email_stats()
                 
         except Exception as e:
             self._log_error("EMAIL DEDUP ERROR", f"Error removing email duplicates: {e}")
     
+    def _remove_exact_email_duplicates(self):
+        """Rewrite emails.txt without exact duplicates in a single streaming pass.
+        
+        Emails count as duplicates when their _email_key matches, as in the store.
+        Returns the set of unique keys, or None if the file holds no emails.
+        The rewrite is skipped when the file has as many lines as the store,
+        since the store mirrors the file's keys and never lets a duplicate get appended.
+        """
+        store = self.parsed_emails
+        store.open()
+        with open('emails.txt', 'r', encoding='utf-8') as f:
+            line_count = sum(1 for line in f if line.strip() and not line.lstrip().startswith('#'))
+        if not line_count:
+            return None
+        if line_count == len(store):
+            logging.info("Removed 0 duplicate emails.")
+            return store
+        
+        seen = set()
+        total = 0
+        with open('emails.txt', 'r', encoding='utf-8') as fin, \
+                open('emails.tmp', 'w', encoding='utf-8', buffering=65536) as fout:
+            for line in fin:
+                email = line.strip()
+                if not email or email.startswith('#'):
+                    continue
+                total += 1
+                key = _email_key(email)
+                if key in seen:
+                    continue
+                seen.add(key)
+                fout.write(f"{email}\n")
+        
+        if not total:
+            os.remove('emails.tmp')
+            return None
+        
+        # Atomic rename so an interrupted run never leaves a truncated emails.txt
+        os.replace('emails.tmp', 'emails.txt')
+        store.mark_synced()
+        logging.info(f"Removed {total - len(seen)} duplicate emails.")
+        return seen
+    
     def run(self):
         """Run the YouTube channel scraper with optimization and error handling."""
         logging.info("Starting YouTube Channel Scraper...")
@@ -2207,12 +2457,14 @@ class YouTubeChannelScraper:
         self.stop_requested = False
         
         # Process initial keywords
-        self.all_keywords = self.keywords.copy()
+        self.all_keywords = deque(dict.fromkeys(self.keywords))
+        self.queued_keywords = set(self.all_keywords)
         self.processed_keywords = set()
         
         while self.all_keywords and not self.stop_requested:
             # Get the next keyword
-            keyword = self.all_keywords.pop(0)
+            keyword = self.all_keywords.popleft()
+            self.queued_keywords.discard(keyword)
             
             # Skip already processed keywords
             if keyword in self.processed_keywords:
@@ -2227,10 +2479,11 @@ class YouTubeChannelScraper:
                 # Process search results and get new keywords
                 new_keywords = self.process_search_results(keyword)
                 
-                # Add new keywords to the queue if they haven't been processed yet
+                # Add new keywords to the queue if they haven't been processed or queued yet
                 for new_keyword in new_keywords:
-                    if new_keyword not in self.processed_keywords:
+                    if new_keyword not in self.processed_keywords and new_keyword not in self.queued_keywords:
                         self.all_keywords.append(new_keyword)
+                        self.queued_keywords.add(new_keyword)
                 
                 # Print progress
                 logging.info(f"Channels found: {len(self.parsed_channels)}")
@@ -2248,13 +2501,13 @@ class YouTubeChannelScraper:
                 # Save email domain statistics periodically
                 self.save_email_stats()
                 
-                # Add delay between different keywords
+                # Back off between keywords only if a key was rate limited
                 if self.all_keywords and not self.stop_requested:
-                    self.random_delay()
+                    self.wait_if_needed()
                     
             except Exception as e:
                 logging.error(f"Error processing keyword '{keyword}': {e}")
-                logging.debug(traceback.format_exc())
+                logging.debug("Exception details:", exc_info=True)
                 
                 # Continue with next keyword
                 continue
@@ -2271,6 +2524,9 @@ class YouTubeChannelScraper:
         # Remove email duplicates when scraping completes
         if not self.stop_requested:
             self.remove_email_duplicates()
+        
+        # Reopened on demand if the store is used again after this run
+        self.parsed_emails.close()
             
     def _initialize_output_files(self):
         """Initialize output files with headers if they don't exist."""
@@ -2301,18 +2557,22 @@ class YouTubeChannelScraper:
                         
         except Exception as e:
             logging.error(f"Error initializing output files: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
         
     def save_email_stats(self):
         """Save statistics about email domains."""
         try:
-            # Sort domains by frequency
-            sorted_domains = sorted(self.email_domains.items(), key=lambda x: x[1], reverse=True)
+            # Nothing new since the last save, the file is already up to date
+            if not self.email_stats_dirty and os.path.exists('email_stats.txt'):
+                return
             
-            with open('email_stats.txt', 'w', encoding='utf-8') as f:
-                f.write("domain,count\n")
-                for domain, count in sorted_domains:
-                    f.write(f"{domain},{count}\n")
+            # The store groups and sorts domains by frequency
+            self.email_stats_dirty = False
+            sorted_domains = self.parsed_emails.domain_counts()
+            self.email_domains = dict(sorted_domains)
+            
+            with open('email_stats.txt', 'w', encoding='utf-8', buffering=65536) as f:
+                f.write("domain,count\n" + ''.join(f"{domain},{count}\n" for domain, count in sorted_domains))
                     
             logging.info(f"Email domain statistics saved to email_stats.txt")
         except Exception as e:
@@ -2321,18 +2581,27 @@ class YouTubeChannelScraper:
     def save_progress(self):
         """Save current progress data for resume capability."""
         try:
-            with open('progress_data.json', 'w', encoding='utf-8') as f:
-                progress = {
-                    'processed_keywords': list(self.processed_keywords),
-                    'pending_keywords': self.all_keywords,
-                    'api_usage': self.api_usage_count,
-                    'daily_quota_usage': self.daily_quota_usage,
-                    'channels_count': len(self.parsed_channels),
-                    'emails_count': len(self.parsed_emails),
-                    'social_count': len(self.parsed_social_media),
-                    'timestamp': datetime.datetime.now().isoformat()
-                }
-                json.dump(progress, f, indent=2)
+            progress = {
+                'processed_keywords': self.processed_keywords,
+                'pending_keywords': self.all_keywords,
+                'api_usage': self.api_usage_count,
+                'daily_quota_usage': self.daily_quota_usage,
+                'channels_count': len(self.parsed_channels),
+                'emails_count': len(self.parsed_emails),
+                'social_count': len(self.parsed_social_media),
+                'timestamp': datetime.datetime.now().isoformat()
+            }
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(progress, default=_json_default, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(progress, indent=2, default=_json_default).encode('utf-8')
+            
+            # Write to a temp file and rename so an interrupted save never corrupts progress;
+            # the lock keeps two savers from writing the same temp file at once
+            with self.progress_lock:
+                with open('progress_data.json.tmp', 'wb') as f:
+                    f.write(data)
+                os.replace('progress_data.json.tmp', 'progress_data.json')
             logging.info("Progress saved successfully")
         except Exception as e:
             self._log_error("PROGRESS SAVE ERROR", f"Error saving progress: {e}")
@@ -2343,15 +2612,18 @@ class YouTubeChannelScraper:
             return False
             
         try:
-            with open('progress_data.json', 'r', encoding='utf-8') as f:
-                progress = json.load(f)
+            with open('progress_data.json', 'rb') as f:
+                data = f.read()
+            progress = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
                 
             self.processed_keywords = set(progress.get('processed_keywords', []))
-            self.all_keywords = progress.get('pending_keywords', [])
+            self.all_keywords = deque(dict.fromkeys(progress.get('pending_keywords', [])))
+            self.queued_keywords = set(self.all_keywords)
             
             # Load API usage data
             api_usage = progress.get('api_usage', {})
             self.api_usage_count = {k: v for k, v in api_usage.items()}
+            self.api_quota_used = any(self.api_usage_count.values())
             
             # Load daily quota usage data
             daily_quota = progress.get('daily_quota_usage', {})
@@ -2393,7 +2665,7 @@ class YouTubeChannelScraper:
             return True
         except Exception as e:
             logging.error(f"Error initializing scraper: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Exception details:", exc_info=True)
             return False
             
 # Интегрируем обработчик API ключей
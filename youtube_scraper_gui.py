@@ -1,13 +1,29 @@
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext
+import tkinter.font as tkfont
 import threading
+import shutil
+import time
 import logging
-import traceback
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from api_validator import validate_api_keys
 import json
+from collections import deque
+from types import MappingProxyType
+
+# orjson parses straight from bytes in C; json.loads also accepts bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        """Compact UTF-8 JSON bytes, as orjson.dumps produces"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 # Import the scraper class from the original script
 # Assuming the original script is saved as youtube_scraper.py
@@ -15,15 +31,18 @@ try:
     from youtube_scraper import YouTubeChannelScraper
 except ImportError:
     # If running standalone, define a wrapper for the class
+    # The stub never collects anything, so its results share immutable empty singletons
+    _EMPTY_USAGE = MappingProxyType({})
+    
     class YouTubeChannelScraper:
         def __init__(self):
             self.api_keys = []
             self.keywords = []
-            self.api_usage_count = {}
-            self.parsed_emails = set()
-            self.parsed_channels = set()
-            self.parsed_social_media = set()
-            self.processed_keywords = set()
+            self.api_usage_count = _EMPTY_USAGE
+            self.parsed_emails = frozenset()
+            self.parsed_channels = frozenset()
+            self.parsed_social_media = frozenset()
+            self.processed_keywords = frozenset()
         
         def initialize(self):
             return True
@@ -37,11 +56,17 @@ except ImportError:
         def remove_email_duplicates(self):
             pass
 
+# Size cap per log file before it is rotated, and how many rotated files are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Writes the GUI's error entries to debug.txt; setup_logging gives it the debug.txt handler
+_debug_logger = logging.getLogger("youtube_scraper_gui.debug")
+
 # Set up logging to file and debug.txt
 def setup_logging():
     # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
+    os.makedirs('logs', exist_ok=True)
     
     # Set up regular logging
     log_file = f"logs/scraper_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
@@ -49,59 +74,573 @@ def setup_logging():
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True),
             logging.StreamHandler(sys.stdout)
         ]
     )
     
-    # Set up debug logging
-    debug_handler = logging.FileHandler("debug.txt")
-    debug_handler.setLevel(logging.DEBUG)
-    debug_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    debug_handler.setFormatter(debug_formatter)
-    
-    # Get the root logger and add the debug handler
+    # Reuse a debug.txt handler that is already installed (by starter.py or an earlier call),
+    # so only one handler ever has the file open
     root_logger = logging.getLogger()
-    root_logger.addHandler(debug_handler)
+    debug_path = os.path.abspath("debug.txt")
+    debug_handler = next((h for h in root_logger.handlers
+                          if isinstance(h, logging.FileHandler) and h.baseFilename == debug_path), None)
+    if debug_handler is None:
+        # Set up debug logging
+        debug_handler = RotatingFileHandler("debug.txt", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True)
+        debug_handler.setLevel(logging.DEBUG)
+        debug_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        debug_handler.setFormatter(debug_formatter)
+        root_logger.addHandler(debug_handler)
+    
+    # Error entries from the GUI go to debug.txt only, through the same handler so rotation sees one open file
+    _debug_logger.propagate = False
+    _debug_logger.handlers[:] = [debug_handler]
     
     return root_logger
 
+# GUI level names mapped to logging levels once at import time
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+def _parse_list(path):
+    """Non-empty, non-comment lines of a small text file, read in one shot"""
+    with open(path, 'rb') as f:
+        data = f.read().decode('utf-8', 'replace')
+    return [s for ln in data.splitlines() if (s := ln.strip()) and not s.startswith('#')]
+
 # Custom logger that also updates the GUI
 class GUILogger:
-    def __init__(self, text_widget):
+    FLUSH_INTERVAL_MS = 50  # How often queued messages are written to the widget
+    MAX_LOG_LINES = 5000    # Lines kept in the widget during long runs
+    TRIM_SLACK = 500        # Extra lines allowed before trimming, to avoid trimming every flush
+    
+    def __init__(self, text_widget, gui_level=None):
         self.text_widget = text_widget
         self.logger = logging.getLogger()
+        
+        # Tcl interpreter and widget path, so _flush can skip the tkinter method wrappers
+        self._tk = text_widget.tk
+        self._tw_path = str(text_widget)
+        # Lowest level shown in the widget; follows the root logger unless given
+        self.gui_level = self.logger.getEffectiveLevel() if gui_level is None else gui_level
+        
+        # Bound logger methods per level name, so log() needs no level branching
+        self._dispatch = {
+            "DEBUG": self.logger.debug,
+            "INFO": self.logger.info,
+            "WARNING": self.logger.warning,
+            "ERROR": self.logger.error,
+        }
+        
+        # Messages are queued here (deque appends are thread-safe) and written
+        # to the widget by _flush on the Tk thread
+        self._queue = deque()
+        
+        # Timestamp text is only reformatted when the wall-clock second changes
+        self._last_sec = 0
+        self._last_ts = ''
+        
+        self.text_widget.after(self.FLUSH_INTERVAL_MS, self._flush)
+    
+    def isEnabledFor(self, level):
+        """Whether a message at this level would reach the widget or any log handler"""
+        level_int = _LEVELS.get(level, logging.INFO)
+        return level_int >= self.gui_level or self.logger.isEnabledFor(level_int)
     
     def log(self, level, message):
-        # Log to regular logger
-        if level == "INFO":
-            self.logger.info(message)
-        elif level == "ERROR":
-            self.logger.error(message)
-        elif level == "WARNING":
-            self.logger.warning(message)
-        elif level == "DEBUG":
-            self.logger.debug(message)
+        level_int = _LEVELS.get(level, logging.INFO)
+        show_in_gui = level_int >= self.gui_level
+        if not show_in_gui and not self.logger.isEnabledFor(level_int):
+            return
+        
+        # Log to regular logger; formatting is deferred until a handler accepts the record
+        self._dispatch.get(level, self.logger.info)("%s", message)
+        
+        if not show_in_gui:
+            return
         
         # Update GUI
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        formatted_message = f"[{timestamp}] {level}: {message}\n"
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_ts = time.strftime('%H:%M:%S', time.localtime(sec))
+            self._last_sec = sec
+        formatted_message = f"[{self._last_ts}] {level}: {message}\n"
         
         # Use different colors based on log level
         tag = level.lower()
         
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, formatted_message, tag)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self._queue.append((tag, formatted_message))
+    
+    def _flush(self):
+        """Write all queued messages to the widget in one editable window."""
+        try:
+            if self._queue:
+                # Group consecutive lines with the same tag into runs, keeping their order
+                runs = []
+                while self._queue:
+                    tag, formatted_message = self._queue.popleft()
+                    if runs and runs[-1][0] == tag:
+                        runs[-1][1].append(formatted_message)
+                    else:
+                        runs.append((tag, [formatted_message]))
+                
+                call, path = self._tk.call, self._tw_path
+                call(path, 'configure', '-state', 'normal')
+                for tag, run in runs:
+                    call(path, 'insert', 'end', "".join(run), tag)
+                
+                # Drop the oldest lines so the widget does not grow without bound
+                lines = int(str(call(path, 'index', 'end-1c')).split('.')[0])
+                if lines > self.MAX_LOG_LINES + self.TRIM_SLACK:
+                    call(path, 'delete', '1.0', f'{lines - self.MAX_LOG_LINES}.0')
+                
+                call(path, 'see', 'end')
+                call(path, 'configure', '-state', 'disabled')
+            self.text_widget.after(self.FLUSH_INTERVAL_MS, self._flush)
+        except tk.TclError:
+            # Widget was destroyed while the window was closing
+            pass
+
+# UI strings per language; built once at import and shared by all windows
+_TRANSLATIONS = {
+    "en": {
+        # Menu items
+        "file_menu": "File",
+        "start_scraping": "Start Scraping",
+        "stop_scraping": "Stop Scraping",
+        "exit": "Exit",
+        "settings_menu": "Settings",
+        "configure_settings": "Configure Settings",
+        "configure_file_paths": "Configure File Paths",
+        "view_menu": "View",
+        "view_keywords": "View Keywords",
+        "view_proxies": "View Proxies",
+        "view_blacklist": "View Blacklist",
+        "view_api_keys": "View API Keys",
+        "view_debug_log": "View Debug Log",
+        "help_menu": "Help",
+        "about": "About",
+        "language_menu": "Language",
+        "email_format_menu": "Email Format",
+        "email_format_full": "Full (with channel info)",
+        "email_format_email_only": "Email Only",
+        "validate_api_keys": "Validate API Keys",
+        "validate_api_btn": "Validate API",
+        "validation_started": "Starting API key validation...",
+        "validation_not_available": "Cannot validate API keys while scraper is running.",
+        "validation_complete_title": "Validation Complete",
+        "validation_error_title": "Validation Error",
+        "validation_success": "Successfully validated {} API keys. Using validated keys for future operations.",
+        "validation_no_valid_keys": "No valid API keys found. Please check your API keys and try again.",
+        "validation_error": "Error during API validation: {}",
+        "validating": "Validating...",
+        "validated": "Validated",
+        "validation_failed": "Failed",
+        "remove_duplicates": "Remove Email Duplicates",
+        
+        # Buttons and labels
+        "configure_settings_btn": "Settings",
+        "configure_file_paths_btn": "File Paths",
+        "view_results_btn": "View Results",
+        
+        # Status items
+        "status_title": "Status",
+        "api_keys_status": "API Keys",
+        "keywords_status": "Keywords",
+        "settings_status": "Settings",
+        "running_status": "Running Status",
+        "api_quota_status": "API Quota",
+        
+        # Statistics items
+        "statistics_title": "Statistics",
+        "channels_found": "Channels Found",
+        "emails_found": "Emails Found",
+        "social_media_found": "Social Media Found",
+        "keywords_processed": "Keywords Processed",
+        
+        # Log titles
+        "log_title": "Log",
+        
+        # Status values
+        "not_loaded": "Not loaded",
+        "loaded": "Loaded",
+        "running": "Running",
+        "stopped": "Stopped",
+        "stopping": "Stopping...",
+        "saved": "Saved",
+        "error": "Error",
+        
+        # Messages
+        "gui_started": "YouTube Channel Scraper GUI started. Ready to configure and run.",
+        "already_running": "The scraper is already running.",
+        "init_failed": "Failed to initialize the scraper. Please check the settings and API keys.",
+        "scraping_started": "Started scraping process.",
+        "scraping_complete": "Scraping completed successfully.",
+        "scraping_stopping": "Stopping scraper. Please wait...",
+        "duplicates_removed": "Email duplicates removed successfully.",
+        "closing_confirmation": "Scraper is running. Do you want to stop it and exit?",
+        
+        # Settings window
+        "settings_window_title": "Configure Settings",
+        "min_subscribers_label": "Minimum Subscribers",
+        "min_subscribers_desc": "Minimum number of subscribers a channel must have",
+        "max_subscribers_label": "Maximum Subscribers",
+        "max_subscribers_desc": "Maximum number of subscribers a channel can have",
+        "min_total_views_label": "Minimum Total Views",
+        "min_total_views_desc": "Minimum number of total views a channel must have",
+        "creation_year_limit_label": "Creation Year Limit",
+        "creation_year_limit_desc": "Only consider channels created after this year",
+        "parse_mode_label": "Parse Mode",
+        "parse_mode_desc": "What to parse: 'email', 'social', or 'both'",
+        "max_workers_label": "Max Worker Threads",
+        "max_workers_desc": "Maximum number of concurrent threads",
+        "batch_size_label": "Batch Size",
+        "batch_size_desc": "Number of items to process in one batch",
+        "use_caching_label": "Use Caching",
+        "use_caching_desc": "Whether to use caching (true/false)",
+        "shorts_filter_mode_label": "Shorts Filter Mode",
+        "shorts_filter_mode_desc": "Filtering mode for channels based on Shorts content",
+        "shorts_mode_1_desc": "Skip channels with only Shorts or more Shorts than regular videos",
+        "shorts_mode_2_desc": "Only include channels with no Shorts videos at all",
+        "shorts_mode_3_desc": "Include all channels meeting other criteria",
+        "save_settings_btn": "Save Settings",
+        
+        # Advanced Email Finder settings
+        "use_advanced_email_finder_label": "Advanced Email Finder",
+        "use_advanced_email_finder_desc": "Use advanced email finding techniques (true/false)",
+        "email_finder_max_depth_label": "Max Site Depth",
+        "email_finder_max_depth_desc": "Maximum depth of scanning linked websites (0-3)",
+        "email_finder_dns_check_label": "DNS Check",
+        "email_finder_dns_check_desc": "Validate email domains via DNS (true/false)",
+        "email_finder_ai_heuristics_label": "AI Heuristics",
+        "email_finder_ai_heuristics_desc": "Use AI-based heuristics for email finding (true/false)",
+        
+        # File paths window
+        "file_paths_window_title": "Configure File Paths",
+        "keywords_file_label": "Keywords File",
+        "keywords_file_desc": "List of keywords to search for",
+        "proxy_file_label": "Proxy File",
+        "proxy_file_desc": "List of proxies to use",
+        "settings_file_label": "Settings File",
+        "settings_file_desc": "Scraper settings",
+        "blacklist_file_label": "Blacklist File",
+        "blacklist_file_desc": "Countries to exclude",
+        "api_file_label": "API Keys File",
+        "api_file_desc": "YouTube API keys",
+        "channels_file_label": "Channels Output",
+        "channels_file_desc": "File to save channel information",
+        "emails_file_label": "Emails Output",
+        "emails_file_desc": "File to save discovered emails",
+        "social_media_file_label": "Social Media Output",
+        "social_media_file_desc": "File to save social media links",
+        "save_file_paths_btn": "Save File Paths",
+        "browse_btn": "Browse",
+        
+        # Results window
+        "results_window_title": "Scraper Results",
+        "channels_tab": "Channels",
+        "emails_tab": "Emails",
+        "social_media_tab": "Social Media",
+        "export_btn": "Export {0} to CSV",
+        "export_successful": "Export Successful",
+        "export_success_msg": "Successfully exported to {0}.",
+        "export_error": "Export Error",
+        "export_error_msg": "Error exporting to CSV: {0}",
+        
+        # About window
+        "about_window_title": "About YouTube Channel Scraper",
+        "about_app_name": "YT Scraper",
+        "about_app_version": "Version 1.0",
+        "about_app_description": "A graphical interface for the YouTube channel scraper script.\nCollects channel data, emails, and social media links.",
+        "close_btn": "Close",
+        
+        # Messages
+        "file_saved": "File {0} saved successfully.",
+        "error_loading_file": "Error loading file {0}: {1}",
+        "file_not_found": "File {0} not found.",
+        "error_saving_file": "Error saving file {0}: {1}",
+        "settings_saved_successfully": "Settings saved successfully.",
+        "file_paths_saved_successfully": "File paths saved successfully.",
+        "file_paths_loaded_successfully": "File paths loaded successfully.",
+        "error_loading_file_paths": "Error loading file paths: {0}",
+        
+        # File editor
+        "edit": "Edit",
+        "save": "Save"
+    },
+    "ru": {
+        # Menu items
+        "file_menu": "Файл",
+        "start_scraping": "Запустить парсинг",
+        "stop_scraping": "Остановить парсинг",
+        "exit": "Выход",
+        "settings_menu": "Настройки",
+        "configure_settings": "Настроить параметры",
+        "configure_file_paths": "Настроить пути файлов",
+        "view_menu": "Просмотр",
+        "view_keywords": "Просмотр ключевых слов",
+        "view_proxies": "Просмотр прокси",
+        "view_blacklist": "Просмотр черного списка",
+        "view_api_keys": "Просмотр API ключей",
+        "view_debug_log": "Просмотр лог файла отладки",
+        "help_menu": "Помощь",
+        "about": "О программе",
+        "language_menu": "Язык",
+        "email_format_menu": "Формат email",
+        "email_format_full": "Полный (с информацией о канале)",
+        "email_format_email_only": "Только email",
+        "validate_api_keys": "Проверить API ключи",
+        "validate_api_btn": "Проверить API",
+        "validation_started": "Начинается проверка API ключей...",
+        "validation_not_available": "Невозможно проверить API ключи пока парсер запущен.",
+        "validation_complete_title": "Проверка завершена",
+        "validation_error_title": "Ошибка проверки",
+        "validation_success": "Успешно проверено {} API ключей. Используются проверенные ключи для будущих операций.",
+        "validation_no_valid_keys": "Не найдено действительных API ключей. Пожалуйста, проверьте ваши API ключи и попробуйте снова.",
+        "validation_error": "Ошибка при проверке API: {}",
+        "validating": "Проверка...",
+        "validated": "Проверены",
+        "validation_failed": "Ошибка",
+        "remove_duplicates": "Удалить дубликаты email",
+        
+        # Buttons and labels
+        "configure_settings_btn": "Настройки",
+        "configure_file_paths_btn": "Пути файлов",
+        "view_results_btn": "Результаты",
+        
+        # Status items
+        "status_title": "Статус",
+        "api_keys_status": "API ключи",
+        "keywords_status": "Ключевые слова",
+        "settings_status": "Настройки",
+        "running_status": "Статус работы",
+        "api_quota_status": "Квота API",
+        
+        # Statistics items
+        "statistics_title": "Статистика",
+        "channels_found": "Найдено каналов",
+        "emails_found": "Найдено email",
+        "social_media_found": "Найдено соц. сетей",
+        "keywords_processed": "Обработано ключевых слов",
+        
+        # Log titles
+        "log_title": "Журнал",
+        
+        # Status values
+        "not_loaded": "Не загружено",
+        "loaded": "Загружено",
+        "running": "Работает",
+        "stopped": "Остановлено",
+        "stopping": "Останавливается...",
+        "saved": "Сохранено",
+        "error": "Ошибка",
+        
+        # Messages
+        "gui_started": "Интерфейс парсера YouTube каналов запущен. Готов к настройке и запуску.",
+        "already_running": "Парсер уже запущен.",
+        "init_failed": "Не удалось инициализировать парсер. Проверьте настройки и API ключи.",
+        "scraping_started": "Процесс парсинга запущен.",
+        "scraping_complete": "Парсинг успешно завершен.",
+        "scraping_stopping": "Останавливаем парсер. Пожалуйста, подождите...",
+        "duplicates_removed": "Дубликаты email успешно удалены.",
+        "closing_confirmation": "Парсер запущен. Хотите остановить его и выйти?",
+        
+        # Settings window
+        "settings_window_title": "Настройка параметров",
+        "min_subscribers_label": "Минимум подписчиков",
+        "min_subscribers_desc": "Минимальное количество подписчиков канала",
+        "max_subscribers_label": "Максимум подписчиков",
+        "max_subscribers_desc": "Максимальное количество подписчиков канала",
+        "min_total_views_label": "Минимум просмотров",
+        "min_total_views_desc": "Минимальное общее количество просмотров канала",
+        "creation_year_limit_label": "Год создания канала",
+        "creation_year_limit_desc": "Учитывать только каналы, созданные после этого года",
+        "parse_mode_label": "Режим парсинга",
+        "parse_mode_desc": "Что парсить: 'email', 'social', или 'both' (оба)",
+        "max_workers_label": "Макс. потоков",
+        "max_workers_desc": "Максимальное количество одновременных потоков",
+        "batch_size_label": "Размер пакета",
+        "batch_size_desc": "Количество элементов для обработки в одном пакете",
+        "use_caching_label": "Использовать кэш",
+        "use_caching_desc": "Использовать кэширование (true/false)",
+        "shorts_filter_mode_label": "Режим фильтрации Shorts",
+        "shorts_filter_mode_desc": "Режим фильтрации каналов на основе Shorts контента",
+        "shorts_mode_1_desc": "Пропускать каналы только с Shorts или с преобладанием Shorts",
+        "shorts_mode_2_desc": "Включать только каналы совсем без Shorts видео",
+        "shorts_mode_3_desc": "Включать все каналы, соответствующие другим критериям",
+        "save_settings_btn": "Сохранить настройки",
+        
+        # Advanced Email Finder settings
+        "use_advanced_email_finder_label": "Расширенный поиск Email",
+        "use_advanced_email_finder_desc": "Использовать расширенные техники поиска email (true/false)",
+        "email_finder_max_depth_label": "Глубина сканирования",
+        "email_finder_max_depth_desc": "Максимальная глубина сканирования связанных сайтов (0-3)",
+        "email_finder_dns_check_label": "DNS проверка",
+        "email_finder_dns_check_desc": "Проверять доменные имена через DNS (true/false)",
+        "email_finder_ai_heuristics_label": "AI эвристика",
+        "email_finder_ai_heuristics_desc": "Использовать AI эвристики для поиска email (true/false)",
+        
+        # File paths window
+        "file_paths_window_title": "Настройка путей файлов",
+        "keywords_file_label": "Файл ключевых слов",
+        "keywords_file_desc": "Список ключевых слов для поиска",
+        "proxy_file_label": "Файл прокси",
+        "proxy_file_desc": "Список прокси для использования",
+        "settings_file_label": "Файл настроек",
+        "settings_file_desc": "Настройки парсера",
+        "blacklist_file_label": "Файл черного списка",
+        "blacklist_file_desc": "Страны для исключения",
+        "api_file_label": "Файл API ключей",
+        "api_file_desc": "API ключи YouTube",
+        "channels_file_label": "Файл каналов",
+        "channels_file_desc": "Файл для сохранения информации о каналах",
+        "emails_file_label": "Файл email",
+        "emails_file_desc": "Файл для сохранения найденных email адресов",
+        "social_media_file_label": "Файл соц. сетей",
+        "social_media_file_desc": "Файл для сохранения ссылок на социальные сети",
+        "save_file_paths_btn": "Сохранить пути файлов",
+        "browse_btn": "Обзор",
+        
+        # Results window
+        "results_window_title": "Результаты парсера",
+        "channels_tab": "Каналы",
+        "emails_tab": "Email",
+        "social_media_tab": "Соц. сети",
+        "export_btn": "Экспорт {0} в CSV",
+        "export_successful": "Экспорт выполнен",
+        "export_success_msg": "Успешно экспортировано в {0}.",
+        "export_error": "Ошибка экспорта",
+        "export_error_msg": "Ошибка экспорта в CSV: {0}",
+        
+        # About window
+        "about_window_title": "О программе YouTube Channel Scraper",
+        "about_app_name": "Парсер YouTube",
+        "about_app_version": "Версия 1.0",
+        "about_app_description": "Графический интерфейс для скрипта парсинга YouTube каналов.\nСобирает данные каналов, email адреса и ссылки на социальные сети.",
+        "close_btn": "Закрыть",
+        
+        # Messages
+        "file_saved": "Файл {0} успешно сохранен.",
+        "error_loading_file": "Ошибка загрузки файла {0}: {1}",
+        "file_not_found": "Файл {0} не найден.",
+        "error_saving_file": "Ошибка сохранения файла {0}: {1}",
+        "settings_saved_successfully": "Настройки успешно сохранены.",
+        "file_paths_saved_successfully": "Пути файлов успешно сохранены.",
+        "file_paths_loaded_successfully": "Пути файлов успешно загружены.",
+        "error_loading_file_paths": "Ошибка загрузки путей файлов: {0}",
+        
+        # File editor
+        "edit": "Редактировать",
+        "save": "Сохранить"
+    }
+}
+_TRANSLATIONS = MappingProxyType({lang: MappingProxyType(table) for lang, table in _TRANSLATIONS.items()})
+
+# Settings shown as dropdowns in the settings dialog; values and descriptions do not depend on the language.
+# Read-only, like _TRANSLATIONS, since every dialog shares it
+_SPECIAL_SETTINGS = {
+    "shorts_filter_mode": {
+        "type": "dropdown",
+        "values": ("1", "2", "3"),
+        "descriptions": {
+            "1": "shorts_mode_1_desc",
+            "2": "shorts_mode_2_desc", 
+            "3": "shorts_mode_3_desc"
+        }
+    },
+    "parse_mode": {
+        "type": "dropdown",
+        "values": ("email", "social", "both"),
+        "descriptions": {
+            "email": "Parse only email addresses",
+            "social": "Parse only social media links",
+            "both": "Parse both email and social media links"
+        }
+    },
+    "use_caching": {
+        "type": "dropdown",
+        "values": ("true", "false"),
+        "descriptions": {
+            "true": "Use caching for better performance",
+            "false": "Do not use caching"
+        }
+    },
+    "use_advanced_email_finder": {
+        "type": "dropdown",
+        "values": ("true", "false"),
+        "descriptions": {
+            "true": "Use advanced techniques to find more emails",
+            "false": "Use standard email detection only"
+        }
+    },
+    "email_finder_dns_check": {
+        "type": "dropdown",
+        "values": ("true", "false"),
+        "descriptions": {
+            "true": "Validate email domains using DNS (slower but more accurate)",
+            "false": "Skip domain validation (faster but may include invalid emails)"
+        }
+    },
+    "email_finder_ai_heuristics": {
+        "type": "dropdown",
+        "values": ("true", "false"),
+        "descriptions": {
+            "true": "Use AI-based techniques to find obfuscated emails",
+            "false": "Use only pattern matching for email detection"
+        }
+    }, 
+    "email_finder_max_depth": {
+        "type": "dropdown",
+        "values": ("0", "1", "2", "3"),
+        "descriptions": {
+            "0": "Don't scan linked websites",
+            "1": "Scan only direct links",
+            "2": "Scan up to 2 levels deep (recommended)",
+            "3": "Deep scan up to 3 levels (slower)"
+        }
+    }
+}
+_SPECIAL_SETTINGS = MappingProxyType({
+    key: MappingProxyType({**spec, "descriptions": MappingProxyType(spec["descriptions"])})
+    for key, spec in _SPECIAL_SETTINGS.items()
+})
+
+# Settings listed under their own heading at the bottom of the settings dialog
+_ADVANCED_SETTING_KEYS = (
+    "use_advanced_email_finder", "email_finder_max_depth",
+    "email_finder_dns_check", "email_finder_ai_heuristics"
+)
 
 class YouTubeScraperGUI:
+    SAVE_CHUNK_LINES = 1024  # Lines fetched from an editor's text widget per get() when saving
+    CHUNKED_INSERT_MIN_CHARS = 1 << 20  # Viewer content above this size is inserted in chunks
+    INSERT_CHUNK_CHARS = 1 << 18        # Characters per chunk, one chunk per idle callback
+    
+    # Rows of the settings dialog, in display order; labels come from "<key>_label" / "<key>_desc"
+    SETTING_KEYS = (
+        "min_subscribers", "max_subscribers", "min_total_views", "creation_year_limit",
+        "parse_mode", "max_workers", "batch_size",
+        "use_caching", "shorts_filter_mode",
+    ) + _ADVANCED_SETTING_KEYS
+    # Rows of the file paths dialog; labels come from "<key>_file_label" / "<key>_file_desc"
+    PATH_KEYS = ("keywords", "proxy", "settings", "blacklist", "api", "channels", "emails", "social_media")
+    
     def __init__(self, root):
         self.root = root
         self.root.title("YouTube Channel Scraper")
         self.root.geometry("800x600")  # Smaller window size
         self.root.configure(bg="white")
         
+        # Named fonts of the settings and file path dialogs; Tk resolves each once and every row refers to it
+        self._font_heading = tkfont.Font(root=self.root, family="Arial", size=12, weight="bold")
+        self._font_label_bold = tkfont.Font(root=self.root, family="Arial", size=10, weight="bold")
+        self._font_desc = tkfont.Font(root=self.root, family="Arial", size=8)
+        
         # Initialize scraper
         self.scraper = YouTubeChannelScraper()
         
@@ -124,7 +663,12 @@ class YouTubeScraperGUI:
         
         # Language setting (en = English, ru = Russian)
         self.language = "en"
-        self.translations = self.load_translations()
+        self.translations = _TRANSLATIONS
+        self._t = self._build_translation_table(self.language)
+        # Shared by the language radiobuttons so they show the current language
+        self._lang_var = tk.StringVar(master=self.root, value=self.language)
+        # Translated (label, description) pairs of the settings dialog, per language
+        self._settings_info_cache = {}
         
         # File paths
         self.file_paths = {
@@ -138,6 +682,26 @@ class YouTubeScraperGUI:
             "emails_detailed": "emails_detailed.txt",
             "social_media": "social_media.txt"
         }
+        self._index_file_paths()
+        
+        # (api keys, usage counts) last shown in the API usage panel
+        self._api_usage_snapshot = None
+        self._api_sig = None
+        self._mask_cache = {}  # API key -> masked display string
+        self._initial_key_count = 0
+        
+        # Last value shown by each status/statistics label, so unchanged values skip the redraw
+        self._status_cache = {}
+        self._stat_cache = {}
+        
+        # (mtime_ns, size, parser, result) per file path, see _cached_file_read
+        self._file_cache = {}
+        # (path, mtime_ns, size, settings dict) of the last parsed settings file
+        self._settings_cache = None
+        # Settings dialog and its entry widgets, hidden rather than destroyed between uses
+        self._settings_window = None
+        self._settings_entries = None
+        self._adv_ctx = None  # (frame, expand button, first row, settings_info, entries) of the collapsed section
         
         # Create the GUI elements
         self.create_menu()
@@ -154,476 +718,133 @@ class YouTubeScraperGUI:
     
     def load_translations(self):
         """Load translations for multilingual support"""
-        translations = {
-            "en": {
-                # Menu items
-                "file_menu": "File",
-                "start_scraping": "Start Scraping",
-                "stop_scraping": "Stop Scraping",
-                "exit": "Exit",
-                "settings_menu": "Settings",
-                "configure_settings": "Configure Settings",
-                "configure_file_paths": "Configure File Paths",
-                "view_menu": "View",
-                "view_keywords": "View Keywords",
-                "view_proxies": "View Proxies",
-                "view_blacklist": "View Blacklist",
-                "view_api_keys": "View API Keys",
-                "view_debug_log": "View Debug Log",
-                "help_menu": "Help",
-                "about": "About",
-                "language_menu": "Language",
-                "email_format_menu": "Email Format",
-                "email_format_full": "Full (with channel info)",
-                "email_format_email_only": "Email Only",
-                "validate_api_keys": "Validate API Keys",
-                "validate_api_btn": "Validate API",
-                "validation_started": "Starting API key validation...",
-                "validation_not_available": "Cannot validate API keys while scraper is running.",
-                "validation_complete_title": "Validation Complete",
-                "validation_error_title": "Validation Error",
-                "validation_success": "Successfully validated {} API keys. Using validated keys for future operations.",
-                "validation_no_valid_keys": "No valid API keys found. Please check your API keys and try again.",
-                "validation_error": "Error during API validation: {}",
-                "validating": "Validating...",
-                "validated": "Validated",
-                "validation_failed": "Failed",
-                "remove_duplicates": "Remove Email Duplicates",
-                
-                # Buttons and labels
-                "configure_settings_btn": "Settings",
-                "configure_file_paths_btn": "File Paths",
-                "view_results_btn": "View Results",
-                
-                # Status items
-                "status_title": "Status",
-                "api_keys_status": "API Keys",
-                "keywords_status": "Keywords",
-                "settings_status": "Settings",
-                "running_status": "Running Status",
-                "api_quota_status": "API Quota",
-                
-                # Statistics items
-                "statistics_title": "Statistics",
-                "channels_found": "Channels Found",
-                "emails_found": "Emails Found",
-                "social_media_found": "Social Media Found",
-                "keywords_processed": "Keywords Processed",
-                
-                # Log titles
-                "log_title": "Log",
-                
-                # Status values
-                "not_loaded": "Not loaded",
-                "loaded": "Loaded",
-                "running": "Running",
-                "stopped": "Stopped",
-                "stopping": "Stopping...",
-                "saved": "Saved",
-                "error": "Error",
-                
-                # Messages
-                "gui_started": "YouTube Channel Scraper GUI started. Ready to configure and run.",
-                "already_running": "The scraper is already running.",
-                "init_failed": "Failed to initialize the scraper. Please check the settings and API keys.",
-                "scraping_started": "Started scraping process.",
-                "scraping_complete": "Scraping completed successfully.",
-                "scraping_stopping": "Stopping scraper. Please wait...",
-                "duplicates_removed": "Email duplicates removed successfully.",
-                "closing_confirmation": "Scraper is running. Do you want to stop it and exit?",
-                
-                # Settings window
-                "settings_window_title": "Configure Settings",
-                "min_subscribers_label": "Minimum Subscribers",
-                "min_subscribers_desc": "Minimum number of subscribers a channel must have",
-                "max_subscribers_label": "Maximum Subscribers",
-                "max_subscribers_desc": "Maximum number of subscribers a channel can have",
-                "min_total_views_label": "Minimum Total Views",
-                "min_total_views_desc": "Minimum number of total views a channel must have",
-                "creation_year_limit_label": "Creation Year Limit",
-                "creation_year_limit_desc": "Only consider channels created after this year",
-                "delay_min_label": "Minimum Delay (seconds)",
-                "delay_min_desc": "Minimum delay between requests",
-                "delay_max_label": "Maximum Delay (seconds)",
-                "delay_max_desc": "Maximum delay between requests",
-                "parse_mode_label": "Parse Mode",
-                "parse_mode_desc": "What to parse: 'email', 'social', or 'both'",
-                "max_workers_label": "Max Worker Threads",
-                "max_workers_desc": "Maximum number of concurrent threads",
-                "batch_size_label": "Batch Size",
-                "batch_size_desc": "Number of items to process in one batch",
-                "use_caching_label": "Use Caching",
-                "use_caching_desc": "Whether to use caching (true/false)",
-                "shorts_filter_mode_label": "Shorts Filter Mode",
-                "shorts_filter_mode_desc": "Filtering mode for channels based on Shorts content",
-                "shorts_mode_1_desc": "Skip channels with only Shorts or more Shorts than regular videos",
-                "shorts_mode_2_desc": "Only include channels with no Shorts videos at all",
-                "shorts_mode_3_desc": "Include all channels meeting other criteria",
-                "save_settings_btn": "Save Settings",
-                
-                # Advanced Email Finder settings
-                "use_advanced_email_finder_label": "Advanced Email Finder",
-                "use_advanced_email_finder_desc": "Use advanced email finding techniques (true/false)",
-                "email_finder_max_depth_label": "Max Site Depth",
-                "email_finder_max_depth_desc": "Maximum depth of scanning linked websites (0-3)",
-                "email_finder_dns_check_label": "DNS Check",
-                "email_finder_dns_check_desc": "Validate email domains via DNS (true/false)",
-                "email_finder_ai_heuristics_label": "AI Heuristics",
-                "email_finder_ai_heuristics_desc": "Use AI-based heuristics for email finding (true/false)",
-                
-                # File paths window
-                "file_paths_window_title": "Configure File Paths",
-                "keywords_file_label": "Keywords File",
-                "keywords_file_desc": "List of keywords to search for",
-                "proxy_file_label": "Proxy File",
-                "proxy_file_desc": "List of proxies to use",
-                "settings_file_label": "Settings File",
-                "settings_file_desc": "Scraper settings",
-                "blacklist_file_label": "Blacklist File",
-                "blacklist_file_desc": "Countries to exclude",
-                "api_file_label": "API Keys File",
-                "api_file_desc": "YouTube API keys",
-                "channels_file_label": "Channels Output",
-                "channels_file_desc": "File to save channel information",
-                "emails_file_label": "Emails Output",
-                "emails_file_desc": "File to save discovered emails",
-                "social_media_file_label": "Social Media Output",
-                "social_media_file_desc": "File to save social media links",
-                "save_file_paths_btn": "Save File Paths",
-                "browse_btn": "Browse",
-                
-                # Results window
-                "results_window_title": "Scraper Results",
-                "channels_tab": "Channels",
-                "emails_tab": "Emails",
-                "social_media_tab": "Social Media",
-                "export_btn": "Export {0} to CSV",
-                "export_successful": "Export Successful",
-                "export_success_msg": "Successfully exported to {0}.",
-                "export_error": "Export Error",
-                "export_error_msg": "Error exporting to CSV: {0}",
-                
-                # About window
-                "about_window_title": "About YouTube Channel Scraper",
-                "about_app_name": "YT Scraper",
-                "about_app_version": "Version 1.0",
-                "about_app_description": "A graphical interface for the YouTube channel scraper script.\nCollects channel data, emails, and social media links.",
-                "close_btn": "Close",
-                
-                # Messages
-                "file_saved": "File {0} saved successfully.",
-                "error_loading_file": "Error loading file {0}: {1}",
-                "file_not_found": "File {0} not found.",
-                "error_saving_file": "Error saving file {0}: {1}",
-                "settings_saved_successfully": "Settings saved successfully.",
-                "file_paths_saved_successfully": "File paths saved successfully.",
-                "file_paths_loaded_successfully": "File paths loaded successfully.",
-                "error_loading_file_paths": "Error loading file paths: {0}",
-                
-                # File editor
-                "edit": "Edit",
-                "save": "Save"
-            },
-            "ru": {
-                # Menu items
-                "file_menu": "Файл",
-                "start_scraping": "Запустить парсинг",
-                "stop_scraping": "Остановить парсинг",
-                "exit": "Выход",
-                "settings_menu": "Настройки",
-                "configure_settings": "Настроить параметры",
-                "configure_file_paths": "Настроить пути файлов",
-                "view_menu": "Просмотр",
-                "view_keywords": "Просмотр ключевых слов",
-                "view_proxies": "Просмотр прокси",
-                "view_blacklist": "Просмотр черного списка",
-                "view_api_keys": "Просмотр API ключей",
-                "view_debug_log": "Просмотр лог файла отладки",
-                "help_menu": "Помощь",
-                "about": "О программе",
-                "language_menu": "Язык",
-                "email_format_menu": "Формат email",
-                "email_format_full": "Полный (с информацией о канале)",
-                "email_format_email_only": "Только email",
-                "validate_api_keys": "Проверить API ключи",
-                "validate_api_btn": "Проверить API",
-                "validation_started": "Начинается проверка API ключей...",
-                "validation_not_available": "Невозможно проверить API ключи пока парсер запущен.",
-                "validation_complete_title": "Проверка завершена",
-                "validation_error_title": "Ошибка проверки",
-                "validation_success": "Успешно проверено {} API ключей. Используются проверенные ключи для будущих операций.",
-                "validation_no_valid_keys": "Не найдено действительных API ключей. Пожалуйста, проверьте ваши API ключи и попробуйте снова.",
-                "validation_error": "Ошибка при проверке API: {}",
-                "validating": "Проверка...",
-                "validated": "Проверены",
-                "validation_failed": "Ошибка",
-                "remove_duplicates": "Удалить дубликаты email",
-                
-                # Buttons and labels
-                "configure_settings_btn": "Настройки",
-                "configure_file_paths_btn": "Пути файлов",
-                "view_results_btn": "Результаты",
-                
-                # Status items
-                "status_title": "Статус",
-                "api_keys_status": "API ключи",
-                "keywords_status": "Ключевые слова",
-                "settings_status": "Настройки",
-                "running_status": "Статус работы",
-                "api_quota_status": "Квота API",
-                
-                # Statistics items
-                "statistics_title": "Статистика",
-                "channels_found": "Найдено каналов",
-                "emails_found": "Найдено email",
-                "social_media_found": "Найдено соц. сетей",
-                "keywords_processed": "Обработано ключевых слов",
-                
-                # Log titles
-                "log_title": "Журнал",
-                
-                # Status values
-                "not_loaded": "Не загружено",
-                "loaded": "Загружено",
-                "running": "Работает",
-                "stopped": "Остановлено",
-                "stopping": "Останавливается...",
-                "saved": "Сохранено",
-                "error": "Ошибка",
-                
-                # Messages
-                "gui_started": "Интерфейс парсера YouTube каналов запущен. Готов к настройке и запуску.",
-                "already_running": "Парсер уже запущен.",
-                "init_failed": "Не удалось инициализировать парсер. Проверьте настройки и API ключи.",
-                "scraping_started": "Процесс парсинга запущен.",
-                "scraping_complete": "Парсинг успешно завершен.",
-                "scraping_stopping": "Останавливаем парсер. Пожалуйста, подождите...",
-                "duplicates_removed": "Дубликаты email успешно удалены.",
-                "closing_confirmation": "Парсер запущен. Хотите остановить его и выйти?",
-                
-                # Settings window
-                "settings_window_title": "Настройка параметров",
-                "min_subscribers_label": "Минимум подписчиков",
-                "min_subscribers_desc": "Минимальное количество подписчиков канала",
-                "max_subscribers_label": "Максимум подписчиков",
-                "max_subscribers_desc": "Максимальное количество подписчиков канала",
-                "min_total_views_label": "Минимум просмотров",
-                "min_total_views_desc": "Минимальное общее количество просмотров канала",
-                "creation_year_limit_label": "Год создания канала",
-                "creation_year_limit_desc": "Учитывать только каналы, созданные после этого года",
-                "delay_min_label": "Минимальная задержка (сек)",
-                "delay_min_desc": "Минимальная задержка между запросами",
-                "delay_max_label": "Максимальная задержка (сек)",
-                "delay_max_desc": "Максимальная задержка между запросами",
-                "parse_mode_label": "Режим парсинга",
-                "parse_mode_desc": "Что парсить: 'email', 'social', или 'both' (оба)",
-                "max_workers_label": "Макс. потоков",
-                "max_workers_desc": "Максимальное количество одновременных потоков",
-                "batch_size_label": "Размер пакета",
-                "batch_size_desc": "Количество элементов для обработки в одном пакете",
-                "use_caching_label": "Использовать кэш",
-                "use_caching_desc": "Использовать кэширование (true/false)",
-                "shorts_filter_mode_label": "Режим фильтрации Shorts",
-                "shorts_filter_mode_desc": "Режим фильтрации каналов на основе Shorts контента",
-                "shorts_mode_1_desc": "Пропускать каналы только с Shorts или с преобладанием Shorts",
-                "shorts_mode_2_desc": "Включать только каналы совсем без Shorts видео",
-                "shorts_mode_3_desc": "Включать все каналы, соответствующие другим критериям",
-                "save_settings_btn": "Сохранить настройки",
-                
-                # Advanced Email Finder settings
-                "use_advanced_email_finder_label": "Расширенный поиск Email",
-                "use_advanced_email_finder_desc": "Использовать расширенные техники поиска email (true/false)",
-                "email_finder_max_depth_label": "Глубина сканирования",
-                "email_finder_max_depth_desc": "Максимальная глубина сканирования связанных сайтов (0-3)",
-                "email_finder_dns_check_label": "DNS проверка",
-                "email_finder_dns_check_desc": "Проверять доменные имена через DNS (true/false)",
-                "email_finder_ai_heuristics_label": "AI эвристика",
-                "email_finder_ai_heuristics_desc": "Использовать AI эвристики для поиска email (true/false)",
-                
-                # File paths window
-                "file_paths_window_title": "Настройка путей файлов",
-                "keywords_file_label": "Файл ключевых слов",
-                "keywords_file_desc": "Список ключевых слов для поиска",
-                "proxy_file_label": "Файл прокси",
-                "proxy_file_desc": "Список прокси для использования",
-                "settings_file_label": "Файл настроек",
-                "settings_file_desc": "Настройки парсера",
-                "blacklist_file_label": "Файл черного списка",
-                "blacklist_file_desc": "Страны для исключения",
-                "api_file_label": "Файл API ключей",
-                "api_file_desc": "API ключи YouTube",
-                "channels_file_label": "Файл каналов",
-                "channels_file_desc": "Файл для сохранения информации о каналах",
-                "emails_file_label": "Файл email",
-                "emails_file_desc": "Файл для сохранения найденных email адресов",
-                "social_media_file_label": "Файл соц. сетей",
-                "social_media_file_desc": "Файл для сохранения ссылок на социальные сети",
-                "save_file_paths_btn": "Сохранить пути файлов",
-                "browse_btn": "Обзор",
-                
-                # Results window
-                "results_window_title": "Результаты парсера",
-                "channels_tab": "Каналы",
-                "emails_tab": "Email",
-                "social_media_tab": "Соц. сети",
-                "export_btn": "Экспорт {0} в CSV",
-                "export_successful": "Экспорт выполнен",
-                "export_success_msg": "Успешно экспортировано в {0}.",
-                "export_error": "Ошибка экспорта",
-                "export_error_msg": "Ошибка экспорта в CSV: {0}",
-                
-                # About window
-                "about_window_title": "О программе YouTube Channel Scraper",
-                "about_app_name": "Парсер YouTube",
-                "about_app_version": "Версия 1.0",
-                "about_app_description": "Графический интерфейс для скрипта парсинга YouTube каналов.\nСобирает данные каналов, email адреса и ссылки на социальные сети.",
-                "close_btn": "Закрыть",
-                
-                # Messages
-                "file_saved": "Файл {0} успешно сохранен.",
-                "error_loading_file": "Ошибка загрузки файла {0}: {1}",
-                "file_not_found": "Файл {0} не найден.",
-                "error_saving_file": "Ошибка сохранения файла {0}: {1}",
-                "settings_saved_successfully": "Настройки успешно сохранены.",
-                "file_paths_saved_successfully": "Пути файлов успешно сохранены.",
-                "file_paths_loaded_successfully": "Пути файлов успешно загружены.",
-                "error_loading_file_paths": "Ошибка загрузки путей файлов: {0}",
-                
-                # File editor
-                "edit": "Редактировать",
-                "save": "Сохранить"
-            }
-        }
-        return translations
+        return _TRANSLATIONS
         
     
+    def _build_translation_table(self, lang):
+        """Merge a language over English so lookups fall back to English in one probe"""
+        return {**self.translations["en"], **self.translations[lang]}
+    
     def get_translation(self, key):
         """Get translated text based on current language"""
-        if key in self.translations[self.language]:
-            return self.translations[self.language][key]
-        # Fallback to English if translation is missing
-        if key in self.translations["en"]:
-            return self.translations["en"][key]
-        # Return the key itself if no translation found
-        return key
+        # Keys without a translation are returned as-is and memoized in the
+        # per-language table, which switch_language rebuilds from scratch
+        return self._t.setdefault(key, key)
     
     def switch_language(self, lang):
         """Switch the UI language"""
         if lang in self.translations:
             self.language = lang
+            self._t = self._build_translation_table(lang)
+            self._lang_var.set(lang)
+            self._settings_info_cache.clear()
+            # The hidden settings dialog carries old-language labels; build it anew next time
+            if self._settings_window is not None:
+                self._settings_window.destroy()
+                self._settings_window = None
             # Update UI text elements
             self.update_ui_language()
-            self.gui_logger.log("INFO", f"Language switched to {lang}")
+            if self.gui_logger.isEnabledFor("INFO"):
+                self.gui_logger.log("INFO", f"Language switched to {lang}")
     
     def update_ui_language(self):
         """Update all UI text elements based on selected language"""
         # Update menu items
         self.recreate_menu()
         
-        # Update status frame
-        self.status_frame.configure(text=self.get_translation("status_title"))
-        
-        # Update statistics frame
-        self.stats_frame.configure(text=self.get_translation("statistics_title"))
-        
-        # Update log frame
-        self.log_frame.configure(text=self.get_translation("log_title"))
-        
-        # Update buttons
-        self.start_button.configure(text=self.get_translation("start_scraping"))
-        self.stop_button.configure(text=self.get_translation("stop_scraping"))
-        
-        # Update other buttons
-        for widget in self.middle_frame.winfo_children():
-            if isinstance(widget, ttk.Button):
-                if widget.cget("text") == "Configure Settings" or widget.cget("text") == "Настроить параметры":
-                    widget.configure(text=self.get_translation("configure_settings_btn"))
-                elif widget.cget("text") == "Configure File Paths" or widget.cget("text") == "Настроить пути файлов":
-                    widget.configure(text=self.get_translation("configure_file_paths_btn"))
-                elif widget.cget("text") == "View Results" or widget.cget("text") == "Результаты":
-                    widget.configure(text=self.get_translation("view_results_btn"))
+        # Update buttons and frames by the translation key they were tagged with
+        _t = self.get_translation
+        for widget in self._translatable_widgets:
+            widget.configure(text=_t(widget._tkey))
+    
+    def _log_debug(self, section, message):
+        """Append an error entry with the current traceback to debug.txt"""
+        # The rotating debug.txt handler timestamps the entry, formats the traceback only when
+        # it writes the record, and serializes UI and worker threads
+        _debug_logger.error("=== %s ===\n%s", section, message, exc_info=True)
+    
+    def _tag_translatable(self, widget, key):
+        """Remember the translation key of a widget so it can be relabelled on language switch"""
+        widget._tkey = key
+        self._translatable_widgets.append(widget)
     
     def create_menu(self):
-        """Create the top menu bar"""
+        """Create the top menu bar; each submenu's entries are built the first time it is opened"""
         self.menu_bar = tk.Menu(self.root)
         
+        # (menu, index, translation key) of every translated entry, for relabelling in place
+        self._menu_entries = []
+        
         # File menu
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        file_menu.add_command(label=self.get_translation("start_scraping"), command=self.start_scraping)
-        file_menu.add_command(label=self.get_translation("stop_scraping"), command=self.stop_scraping)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.get_translation("remove_duplicates"), command=self.remove_email_duplicates)
-        file_menu.add_separator()
-        file_menu.add_command(label=self.get_translation("exit"), command=self.on_exit)
-        self.menu_bar.add_cascade(label=self.get_translation("file_menu"), menu=file_menu)
+        def fill_file_menu(file_menu):
+            self._add_menu_command(file_menu, "start_scraping", self.start_scraping)
+            self._add_menu_command(file_menu, "stop_scraping", self.stop_scraping)
+            file_menu.add_separator()
+            self._add_menu_command(file_menu, "remove_duplicates", self.remove_email_duplicates)
+            file_menu.add_separator()
+            self._add_menu_command(file_menu, "exit", self.on_exit)
+        self._add_menu_cascade("file_menu", fill_file_menu)
         
         # Settings menu
-        settings_menu = tk.Menu(self.menu_bar, tearoff=0)
-        settings_menu.add_command(
-            label=self.get_translation("configure_settings"), 
-            command=self.open_settings
-        )
-        settings_menu.add_command(
-            label=self.get_translation("configure_file_paths"), 
-            command=self.open_file_paths
-        )
-        
-        settings_menu.add_separator()
-        settings_menu.add_command(
-            label=self.get_translation("validate_api_keys"),
-            command=self.validate_api_keys
-        )
-        self.menu_bar.add_cascade(label=self.get_translation("settings_menu"), menu=settings_menu)
+        def fill_settings_menu(settings_menu):
+            self._add_menu_command(settings_menu, "configure_settings", self.open_settings)
+            self._add_menu_command(settings_menu, "configure_file_paths", self.open_file_paths)
+            
+            settings_menu.add_separator()
+            self._add_menu_command(settings_menu, "validate_api_keys", self.validate_api_keys)
+        self._add_menu_cascade("settings_menu", fill_settings_menu)
         
         # View menu
-        view_menu = tk.Menu(self.menu_bar, tearoff=0)
-        view_menu.add_command(
-            label=self.get_translation("view_keywords"), 
-            command=lambda: self.open_file_editor("keywords")
-        )
-        view_menu.add_command(
-            label=self.get_translation("view_proxies"), 
-            command=lambda: self.open_file_editor("proxy")
-        )
-        view_menu.add_command(
-            label=self.get_translation("view_blacklist"), 
-            command=lambda: self.open_file_editor("blacklist")
-        )
-        view_menu.add_command(
-            label=self.get_translation("view_api_keys"), 
-            command=lambda: self.open_file_editor("api")
-        )
-        view_menu.add_separator()
-        view_menu.add_command(
-            label=self.get_translation("view_debug_log"), 
-            command=lambda: self.open_file_viewer("debug.txt")
-        )
-        self.menu_bar.add_cascade(label=self.get_translation("view_menu"), menu=view_menu)
+        def fill_view_menu(view_menu):
+            self._add_menu_command(view_menu, "view_keywords", lambda: self.open_file_editor("keywords"))
+            self._add_menu_command(view_menu, "view_proxies", lambda: self.open_file_editor("proxy"))
+            self._add_menu_command(view_menu, "view_blacklist", lambda: self.open_file_editor("blacklist"))
+            self._add_menu_command(view_menu, "view_api_keys", lambda: self.open_file_editor("api"))
+            view_menu.add_separator()
+            self._add_menu_command(view_menu, "view_debug_log", lambda: self.open_file_viewer("debug.txt"))
+        self._add_menu_cascade("view_menu", fill_view_menu)
         
         # Language menu
-        language_menu = tk.Menu(self.menu_bar, tearoff=0)
-        language_menu.add_radiobutton(
-            label="English", 
-            variable=tk.StringVar(value=self.language),
-            value="en",
-            command=lambda: self.switch_language("en")
-        )
-        language_menu.add_radiobutton(
-            label="Русский", 
-            variable=tk.StringVar(value=self.language),
-            value="ru",
-            command=lambda: self.switch_language("ru")
-        )
-        self.menu_bar.add_cascade(label=self.get_translation("language_menu"), menu=language_menu)
+        def fill_language_menu(language_menu):
+            language_menu.add_radiobutton(
+                label="English", 
+                variable=self._lang_var,
+                value="en",
+                command=lambda: self.switch_language("en")
+            )
+            language_menu.add_radiobutton(
+                label="Русский", 
+                variable=self._lang_var,
+                value="ru",
+                command=lambda: self.switch_language("ru")
+            )
+        self._add_menu_cascade("language_menu", fill_language_menu)
         
         # Help menu
-        help_menu = tk.Menu(self.menu_bar, tearoff=0)
-        help_menu.add_command(label=self.get_translation("about"), command=self.show_about)
-        self.menu_bar.add_cascade(label=self.get_translation("help_menu"), menu=help_menu)
+        def fill_help_menu(help_menu):
+            self._add_menu_command(help_menu, "about", self.show_about)
+        self._add_menu_cascade("help_menu", fill_help_menu)
         
         # Apply the menu bar to the root window
         self.root.config(menu=self.menu_bar)
     
+    def _add_menu_command(self, menu, key, command):
+        """Add a translated menu command and remember its position"""
+        menu.add_command(label=self._t.get(key, key), command=command)
+        self._menu_entries.append((menu, menu.index("end"), key))
+    
+    def _add_menu_cascade(self, key, fill):
+        """Add a translated submenu to the menu bar; fill(submenu) adds its entries just before it is first posted"""
+        submenu = tk.Menu(self.menu_bar, tearoff=0)
+        
+        def build():
+            submenu.configure(postcommand="")
+            fill(submenu)
+        
+        submenu.configure(postcommand=build)
+        self.menu_bar.add_cascade(label=self._t.get(key, key), menu=submenu)
+        self._menu_entries.append((self.menu_bar, self.menu_bar.index("end"), key))
+    
     def validate_api_keys(self):
         """Validate YouTube API keys using the api_validator module."""
         if self.is_running:
@@ -649,35 +870,37 @@ class YouTubeScraperGUI:
             api_file = self.file_paths["api"]
             output_file = 'Good_API.txt'
             
+            # Imported here so the validator and its API client load off the UI thread, only when used
+            from api_validator import validate_api_keys
+            
             # Run the validation
             success = validate_api_keys(api_file, output_file)
             
+            # Read the validated keys here so the UI thread never touches the disk
+            valid_keys = None
+            if success:
+                valid_keys = _parse_list(output_file)
+            
             # Update UI on the main thread
-            self.root.after(0, lambda: self._validation_completed(success, output_file))
+            self.root.after(0, lambda vk=valid_keys: self._validation_completed(success, output_file, vk))
             
         except Exception as e:
             error_msg = f"Error during API validation: {str(e)}"
             
             # Log the error
             logging.error(error_msg)
-            with open("debug.txt", "a") as f:
-                f.write(f"=== API VALIDATION ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("API VALIDATION ERROR", error_msg)
             
             # Update UI on the main thread
             self.root.after(0, lambda: self._validation_failed(str(e)))
 
-    def _validation_completed(self, success, output_file):
-        """Handle completion of API validation."""
+    def _validation_completed(self, success, output_file, valid_keys=None):
+        """Handle completion of API validation (valid_keys is parsed by the worker thread)."""
         if success:
-            # Read the validated keys
             try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    valid_keys = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-                    
                 # Update the file path to use validated keys
                 self.file_paths["api"] = output_file
+                self._index_file_paths()
                 
                 # Update the scraper's API keys
                 self.scraper.api_keys = valid_keys
@@ -718,9 +941,10 @@ class YouTubeScraperGUI:
         )
     
     def recreate_menu(self):
-        """Recreate the menu with updated language"""
-        self.root.config(menu="")  # Remove existing menu
-        self.create_menu()  # Create new menu
+        """Relabel the existing menu entries with the current language"""
+        _t = self.get_translation
+        for menu, index, key in self._menu_entries:
+            menu.entryconfigure(index, label=_t(key))
     
     def create_main_frame(self):
         """Create the main frame with all controls"""
@@ -741,11 +965,18 @@ class YouTubeScraperGUI:
                       background=[('active', '#D32F2F')],  # Darker red
                       foreground=[('active', 'black')])
         
+        # Fonts of the status and statistics rows, resolved once per style rather than per label
+        self.style.configure("Bold9.TLabel", font=("Arial", 9, "bold"))
+        self.style.configure("Reg9.TLabel", font=("Arial", 9))
+        
         self.style.configure("Blue.TButton", background=self.colors["button_bg"], foreground="black")
         self.style.map("Blue.TButton",
                       background=[('active', self.colors["button_active"])],
                       foreground=[('active', 'black')])
         
+        # Widgets relabelled on language switch, each tagged with its translation key
+        self._translatable_widgets = []
+        
         # Create main container frame
         self.main_frame = ttk.Frame(self.root, padding=5)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -762,6 +993,7 @@ class YouTubeScraperGUI:
             style="Green.TButton"
         )
         self.start_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(self.start_button, "start_scraping")
         
         # Stop button
         self.stop_button = ttk.Button(
@@ -771,6 +1003,7 @@ class YouTubeScraperGUI:
             style="Red.TButton"
         )
         self.stop_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(self.stop_button, "stop_scraping")
         self.stop_button.config(state=tk.DISABLED)
         
         # Middle frame with settings buttons and status
@@ -785,6 +1018,7 @@ class YouTubeScraperGUI:
             style="Blue.TButton"
         )
         settings_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(settings_button, "configure_settings_btn")
         
         # File paths button
         file_paths_button = ttk.Button(
@@ -794,6 +1028,7 @@ class YouTubeScraperGUI:
             style="Blue.TButton"
         )
         file_paths_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(file_paths_button, "configure_file_paths_btn")
         
         # View Results button
         view_results_button = ttk.Button(
@@ -803,6 +1038,7 @@ class YouTubeScraperGUI:
             style="Blue.TButton"
         )
         view_results_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(view_results_button, "view_results_btn")
         
         # API Validator button
         validate_api_button = ttk.Button(
@@ -812,6 +1048,7 @@ class YouTubeScraperGUI:
             style="Blue.TButton"
         )
         validate_api_button.pack(side=tk.LEFT, padx=2)
+        self._tag_translatable(validate_api_button, "validate_api_btn")
         
         # Two-column layout for status, stats and log
         self.info_frame = ttk.Frame(self.main_frame)
@@ -828,6 +1065,7 @@ class YouTubeScraperGUI:
             padding=3
         )
         self.status_frame.pack(fill=tk.X, pady=2)
+        self._tag_translatable(self.status_frame, "status_title")
         
         # Status indicators
         self.status_indicators = {}
@@ -839,21 +1077,7 @@ class YouTubeScraperGUI:
             ("API Quota", "OK")
         ]
         
-        # Use grid layout for more compact display
-        for i, (label_key, value) in enumerate(status_items):
-            label_text = self.get_translation(label_key) if label_key in self.translations[self.language] else label_key
-            
-            label_widget = ttk.Label(
-                self.status_frame, 
-                text=f"{label_text}:", 
-                font=("Arial", 9, "bold")
-            )
-            label_widget.grid(row=i, column=0, sticky=tk.W, padx=2, pady=1)
-            
-            value_widget = ttk.Label(self.status_frame, text=value, font=("Arial", 9))
-            value_widget.grid(row=i, column=1, sticky=tk.W, padx=2, pady=1)
-            
-            self.status_indicators[label_key] = value_widget
+        self._build_kv_grid(self.status_frame, status_items, self.status_indicators)
         
         # Statistics frame
         self.stats_frame = ttk.LabelFrame(
@@ -862,6 +1086,7 @@ class YouTubeScraperGUI:
             padding=3
         )
         self.stats_frame.pack(fill=tk.X, pady=2)
+        self._tag_translatable(self.stats_frame, "statistics_title")
         
         # Statistics indicators
         self.stats_indicators = {}
@@ -872,21 +1097,7 @@ class YouTubeScraperGUI:
             ("Keywords Processed", "0")
         ]
         
-        # Use grid layout for more compact display
-        for i, (label_key, value) in enumerate(stats_items):
-            label_text = self.get_translation(label_key) if label_key in self.translations[self.language] else label_key
-            
-            label_widget = ttk.Label(
-                self.stats_frame, 
-                text=f"{label_text}:", 
-                font=("Arial", 9, "bold")
-            )
-            label_widget.grid(row=i, column=0, sticky=tk.W, padx=2, pady=1)
-            
-            value_widget = ttk.Label(self.stats_frame, text=value, font=("Arial", 9))
-            value_widget.grid(row=i, column=1, sticky=tk.W, padx=2, pady=1)
-            
-            self.stats_indicators[label_key] = value_widget
+        self._build_kv_grid(self.stats_frame, stats_items, self.stats_indicators)
         
         # API usage frame
         self.api_frame = ttk.LabelFrame(
@@ -912,6 +1123,7 @@ class YouTubeScraperGUI:
             padding=3
         )
         self.log_frame.pack(fill=tk.BOTH, expand=True, pady=2)
+        self._tag_translatable(self.log_frame, "log_title")
         
         # Create scrolled text widget for logging
         self.log_text = scrolledtext.ScrolledText(self.log_frame, width=50, height=20)
@@ -927,67 +1139,114 @@ class YouTubeScraperGUI:
         # Create GUI logger
         self.gui_logger = GUILogger(self.log_text)
     
+    def _build_kv_grid(self, frame, items, indicators):
+        """Grid "label: value" rows into frame and record each value label in indicators under its key"""
+        tbl = self._t
+        # Use grid layout for more compact display
+        for i, (label_key, value) in enumerate(items):
+            label_text = tbl.get(label_key, label_key)
+            ttk.Label(frame, text=f"{label_text}:", style="Bold9.TLabel").grid(
+                row=i, column=0, sticky=tk.W, padx=2, pady=1
+            )
+            
+            value_widget = ttk.Label(frame, text=value, style="Reg9.TLabel")
+            value_widget.grid(row=i, column=1, sticky=tk.W, padx=2, pady=1)
+            
+            indicators[label_key] = value_widget
+    
     def check_files_status(self):
         """Check the status of required files and update indicators"""
+        _t = self.get_translation
+        loaded, not_loaded = _t("loaded"), _t("not_loaded")
+        
         # Check API keys
         try:
-            with open(self.file_paths["api"], 'r', encoding='utf-8') as f:
-                api_keys = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-                if api_keys:
-                    self.update_status("API Keys", self.get_translation("loaded"), "green")
-                    # Also update scraper's api_keys list for GUI display
-                    self.scraper.api_keys = api_keys
-                else:
-                    self.update_status("API Keys", self.get_translation("not_loaded"), "red")
+            api_keys = self._load_nonblank(self.file_paths["api"])
+            if api_keys:
+                self.update_status("API Keys", loaded, "green")
+                # Also update scraper's api_keys list for GUI display
+                self.scraper.api_keys = list(api_keys)
+            else:
+                self.update_status("API Keys", not_loaded, "red")
         except Exception:
-            self.update_status("API Keys", self.get_translation("not_loaded"), "red")
+            self.update_status("API Keys", not_loaded, "red")
         
         # Check keywords
         try:
-            with open(self.file_paths["keywords"], 'r', encoding='utf-8') as f:
-                keywords = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-                if keywords:
-                    self.update_status("Keywords", self.get_translation("loaded"), "green")
-                    # Also update scraper's keywords list for GUI display
-                    self.scraper.keywords = keywords
-                else:
-                    self.update_status("Keywords", self.get_translation("not_loaded"), "red")
+            keywords = self._load_nonblank(self.file_paths["keywords"])
+            if keywords:
+                self.update_status("Keywords", loaded, "green")
+                # Also update scraper's keywords list for GUI display
+                self.scraper.keywords = list(keywords)
+            else:
+                self.update_status("Keywords", not_loaded, "red")
         except Exception:
-            self.update_status("Keywords", self.get_translation("not_loaded"), "red")
+            self.update_status("Keywords", not_loaded, "red")
         
-        # Check settings
+        # Check settings; only whether there is any setting matters
         try:
-            with open(self.file_paths["settings"], 'r', encoding='utf-8') as f:
-                has_settings = False
-                for line in f:
-                    if line.strip() and not line.strip().startswith('#'):
-                        has_settings = True
-                        break
-                
-                if has_settings:
-                    self.update_status("Settings", self.get_translation("loaded"), "green")
-                else:
-                    self.update_status("Settings", self.get_translation("not_loaded"), "red")
+            if self._load_nonblank(self.file_paths["settings"]):
+                self.update_status("Settings", loaded, "green")
+            else:
+                self.update_status("Settings", not_loaded, "red")
         except Exception:
-            self.update_status("Settings", self.get_translation("not_loaded"), "red")
+            self.update_status("Settings", not_loaded, "red")
         
         # Update API usage text
         self.update_api_usage_text()
     
+    def _cached_file_read(self, path, parse):
+        """Return parse(path), reusing the last result while the file's mtime and size are unchanged"""
+        st = os.stat(path)
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] is parse:
+            return cached[3]
+        result = parse(path)
+        self._file_cache[path] = (st.st_mtime_ns, st.st_size, parse, result)
+        return result
+    
+    def _load_nonblank(self, path):
+        """Non-empty, non-comment lines of a file as a tuple, cached by mtime and size"""
+        return self._cached_file_read(path, self._parse_nonblank)
+    
+    @staticmethod
+    def _parse_nonblank(path):
+        return tuple(_parse_list(path))
+    
     def update_api_usage_text(self):
         """Update the API usage text widget with current API key information"""
+        api_keys = tuple(getattr(self.scraper, 'api_keys', None) or ())
+        usage_counts = tuple(self.scraper.api_usage_count.get(key, 0) for key in api_keys)
+        snapshot = (api_keys, usage_counts)
+        if snapshot == self._api_usage_snapshot:
+            return
+        
+        previous = self._api_usage_snapshot
+        self._api_usage_snapshot = snapshot
+        
+        # Same keys as last time: rewrite only the "Uses" lines whose count moved
+        if api_keys and previous is not None and previous[0] == api_keys:
+            self.api_text.configure(state='normal')
+            for i, (old_count, usage_count) in enumerate(zip(previous[1], usage_counts)):
+                if old_count != usage_count:
+                    line = 4 + 2 * i  # Header, blank line, then a key line and a "Uses" line per key
+                    self.api_text.delete(f"{line}.0", f"{line}.end")
+                    self.api_text.insert(f"{line}.0", f"   Uses: {usage_count}")
+            self.api_text.configure(state='disabled')
+            return
+        
         self.api_text.configure(state='normal')
         self.api_text.delete(1.0, tk.END)
         
-        if hasattr(self.scraper, 'api_keys') and self.scraper.api_keys:
-            self.api_text.insert(tk.END, f"API Keys: {len(self.scraper.api_keys)}\n\n")
+        if api_keys:
+            self.api_text.insert(tk.END, f"API Keys: {len(api_keys)}\n\n")
             
-            for i, key in enumerate(self.scraper.api_keys):
-                # Mask most of the key for security
-                masked_key = key[:4] + '*' * (len(key) - 8) + key[-4:] if len(key) > 8 else '*' * len(key)
-                
-                # Show usage count if available
-                usage_count = self.scraper.api_usage_count.get(key, 0)
+            # Masks are reused across rebuilds; keeping only current keys bounds the cache
+            mask_cache = self._mask_cache
+            self._mask_cache = {key: mask_cache.get(key) or self._mask_key(key) for key in api_keys}
+            
+            for i, (key, usage_count) in enumerate(zip(api_keys, usage_counts)):
+                masked_key = self._mask_cache[key]
                 
                 self.api_text.insert(tk.END, f"{i+1}. {masked_key}\n")
                 self.api_text.insert(tk.END, f"   Uses: {usage_count}\n")
@@ -996,6 +1255,11 @@ class YouTubeScraperGUI:
         
         self.api_text.configure(state='disabled')
     
+    @staticmethod
+    def _mask_key(key):
+        """Mask most of the key for security"""
+        return key[:4] + '*' * (len(key) - 8) + key[-4:] if len(key) > 8 else '*' * len(key)
+    
     def start_scraping(self):
         """Start the scraping process in a separate thread"""
         if self.is_running:
@@ -1018,6 +1282,9 @@ class YouTubeScraperGUI:
             self.is_running = True
             self.update_status("Running Status", self.get_translation("running"), "green")
             
+            # Keys dropped by the scraper after this point mean some exceeded their quota
+            self._initial_key_count = len(getattr(self.scraper, 'api_keys', None) or ())
+            
             # Disable start button, enable stop button
             self.start_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
@@ -1037,10 +1304,7 @@ class YouTubeScraperGUI:
             self.gui_logger.log("ERROR", error_msg)
             
             # Also log detailed traceback to debug.txt
-            with open("debug.txt", "a") as f:
-                f.write(f"=== ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("ERROR", error_msg)
     
     def run_scraper(self):
         """Run the scraper with error handling"""
@@ -1052,10 +1316,7 @@ class YouTubeScraperGUI:
             self.gui_logger.log("ERROR", error_msg)
             
             # Log detailed error to debug.txt
-            with open("debug.txt", "a") as f:
-                f.write(f"=== RUNTIME ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("RUNTIME ERROR", error_msg)
         finally:
             # Update UI when done
             self.root.after(0, self.scraping_finished)
@@ -1078,15 +1339,17 @@ class YouTubeScraperGUI:
         self.gui_logger.log("INFO", self.get_translation("scraping_stopping"))
         
         # Call the scraper's stop method if available
-        if hasattr(self.scraper, 'stop'):
-            self.scraper.stop()
+        stop = getattr(self.scraper, 'stop', None)
+        if stop is not None:
+            stop()
         else:
             # Fallback: Set a flag to stop the scraper
             self.is_running = False
             
             # This will allow the scraper to finish current task and save progress
-            if hasattr(self.scraper, 'save_progress'):
-                self.scraper.save_progress()
+            save_progress = getattr(self.scraper, 'save_progress', None)
+            if save_progress is not None:
+                save_progress()
         
         self.update_status("Running Status", self.get_translation("stopping"), "orange")
         self.stop_button.config(state=tk.DISABLED)
@@ -1097,36 +1360,45 @@ class YouTubeScraperGUI:
             return
         
         try:
+            scraper = self.scraper
+            
             # Update channel count
-            if hasattr(self.scraper, 'parsed_channels'):
-                self.update_stat("Channels Found", str(len(self.scraper.parsed_channels)))
+            parsed = getattr(scraper, 'parsed_channels', None)
+            if parsed is not None:
+                self.update_stat("Channels Found", str(len(parsed)))
             
             # Update email count
-            if hasattr(self.scraper, 'parsed_emails'):
-                self.update_stat("Emails Found", str(len(self.scraper.parsed_emails)))
+            parsed = getattr(scraper, 'parsed_emails', None)
+            if parsed is not None:
+                self.update_stat("Emails Found", str(len(parsed)))
             
             # Update social media count
-            if hasattr(self.scraper, 'parsed_social_media'):
-                self.update_stat("Social Media Found", str(len(self.scraper.parsed_social_media)))
+            parsed = getattr(scraper, 'parsed_social_media', None)
+            if parsed is not None:
+                self.update_stat("Social Media Found", str(len(parsed)))
             
             # Update processed keywords
-            if hasattr(self.scraper, 'processed_keywords'):
-                self.update_stat("Keywords Processed", str(len(self.scraper.processed_keywords)))
-            
-            # Update API usage display
-            self.update_api_usage_text()
+            parsed = getattr(scraper, 'processed_keywords', None)
+            if parsed is not None:
+                self.update_stat("Keywords Processed", str(len(parsed)))
+            
+            # Update API usage display, unless no key was added, replaced or used since the last tick
+            api_keys = getattr(self.scraper, 'api_keys', None)
+            # Worker threads add keys to the dict while this runs, so iterate over a copy
+            usage = dict(self.scraper.api_usage_count)
+            api_sig = (id(api_keys), len(api_keys or ()), sum(usage.values()))
+            if api_sig != self._api_sig:
+                self._api_sig = api_sig
+                self.update_api_usage_text()
             
             # Check API quota status
-            if hasattr(self.scraper, 'api_keys') and self.scraper.api_keys:
-                initial_count = len(self.scraper.api_keys)
-                current_count = len(self.scraper.api_keys)
-                quota_used = False
-                
-                for key, count in self.scraper.api_usage_count.items():
-                    if count > 0:
-                        quota_used = True
+            if api_keys:
+                # The scraper flags first use itself; fall back to a short-circuiting scan
+                quota_used = getattr(self.scraper, 'api_quota_used', None)
+                if quota_used is None:
+                    quota_used = any(usage.values())
                 
-                if current_count < initial_count:
+                if len(api_keys) < self._initial_key_count:
                     self.update_status("API Quota", "Warning: Some keys exceeded quota", "orange")
                 elif quota_used:
                     self.update_status("API Quota", "OK - In use", "green")
@@ -1139,23 +1411,22 @@ class YouTubeScraperGUI:
             self.gui_logger.log("ERROR", f"Error updating statistics: {str(e)}")
             
             # Log to debug.txt
-            with open("debug.txt", "a") as f:
-                f.write(f"=== STATISTICS ERROR AT {datetime.now()} ===\n")
-                f.write(f"Error updating statistics: {str(e)}\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("STATISTICS ERROR", f"Error updating statistics: {str(e)}")
         
-        # Schedule next update
+        # Schedule next update; after_idle lets pending UI events run first
         if self.is_running:
-            self.root.after(1000, self.update_statistics)
+            self.root.after(1000, lambda: self.root.after_idle(self.update_statistics))
     
     def update_status(self, key, value, color="black"):
         """Update a status indicator"""
-        if key in self.status_indicators:
+        if key in self.status_indicators and self._status_cache.get(key) != (value, color):
+            self._status_cache[key] = (value, color)
             self.status_indicators[key].config(text=value, foreground=color)
     
     def update_stat(self, key, value):
         """Update a statistics indicator"""
-        if key in self.stats_indicators:
+        if key in self.stats_indicators and self._stat_cache.get(key) != value:
+            self._stat_cache[key] = value
             self.stats_indicators[key].config(text=value)
     
     def remove_email_duplicates(self):
@@ -1173,13 +1444,17 @@ class YouTubeScraperGUI:
                 self.gui_logger.log("ERROR", error_msg)
                 
                 # Log to debug.txt
-                with open("debug.txt", "a") as f:
-                    f.write(f"=== EMAIL DEDUP ERROR AT {datetime.now()} ===\n")
-                    f.write(error_msg + "\n")
-                    f.write(traceback.format_exc() + "\n\n")
+                self._log_debug("EMAIL DEDUP ERROR", error_msg)
     
     def open_settings(self):
-        """Open the settings editor window"""
+        """Open the settings editor window, reusing the hidden one from the last time if there is one"""
+        window = self._settings_window
+        if window is not None and window.winfo_exists():
+            self._fill_settings_entries(self._settings_entries, self.load_settings_dict())
+            window.deiconify()
+            window.lift()
+            return
+        
         settings_window = tk.Toplevel(self.root)
         settings_window.title(self.get_translation("settings_window_title"))
         settings_window.geometry("600x500")
@@ -1200,7 +1475,7 @@ class YouTubeScraperGUI:
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
     
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        # The frame is embedded in the canvas only once all rows exist, so Tk lays it out in one pass
         canvas.configure(yscrollcommand=scrollbar.set)
     
         # Размещаем канву и полосу прокрутки в основном фрейме
@@ -1214,224 +1489,45 @@ class YouTubeScraperGUI:
         settings_entries = {}
         row = 0
     
-        # Настройки с описаниями
-        settings_info = {
-            "min_subscribers": (self.get_translation("min_subscribers_label"), self.get_translation("min_subscribers_desc")),
-            "max_subscribers": (self.get_translation("max_subscribers_label"), self.get_translation("max_subscribers_desc")),
-            "min_total_views": (self.get_translation("min_total_views_label"), self.get_translation("min_total_views_desc")),
-            "creation_year_limit": (self.get_translation("creation_year_limit_label"), self.get_translation("creation_year_limit_desc")),
-            "delay_min": (self.get_translation("delay_min_label"), self.get_translation("delay_min_desc")),
-            "delay_max": (self.get_translation("delay_max_label"), self.get_translation("delay_max_desc")),
-            "parse_mode": (self.get_translation("parse_mode_label"), self.get_translation("parse_mode_desc")),
-            "max_workers": (self.get_translation("max_workers_label"), self.get_translation("max_workers_desc")),
-            "batch_size": (self.get_translation("batch_size_label"), self.get_translation("batch_size_desc")),
-            "use_caching": (self.get_translation("use_caching_label"), self.get_translation("use_caching_desc")),
-            "shorts_filter_mode": (self.get_translation("shorts_filter_mode_label"), self.get_translation("shorts_filter_mode_desc")),
-            # Advanced Email Finder settings
-            "use_advanced_email_finder": (self.get_translation("use_advanced_email_finder_label"), self.get_translation("use_advanced_email_finder_desc")),
-            "email_finder_max_depth": (self.get_translation("email_finder_max_depth_label"), self.get_translation("email_finder_max_depth_desc")),
-            "email_finder_dns_check": (self.get_translation("email_finder_dns_check_label"), self.get_translation("email_finder_dns_check_desc")),
-            "email_finder_ai_heuristics": (self.get_translation("email_finder_ai_heuristics_label"), self.get_translation("email_finder_ai_heuristics_desc"))
-        }
-    
-        # Создаем словарь для специальных типов настроек (выпадающие списки и т.д.)
-        special_settings = {
-            "shorts_filter_mode": {
-                "type": "dropdown",
-                "values": ["1", "2", "3"],
-                "descriptions": {
-                    "1": "shorts_mode_1_desc",
-                    "2": "shorts_mode_2_desc", 
-                    "3": "shorts_mode_3_desc"
-                }
-            },
-            "parse_mode": {
-                "type": "dropdown",
-                "values": ["email", "social", "both"],
-                "descriptions": {
-                    "email": "Parse only email addresses",
-                    "social": "Parse only social media links",
-                    "both": "Parse both email and social media links"
-                }
-            },
-            "use_caching": {
-                "type": "dropdown",
-                "values": ["true", "false"],
-                "descriptions": {
-                    "true": "Use caching for better performance",
-                    "false": "Do not use caching"
-                }
-            },
-            "use_advanced_email_finder": {
-                "type": "dropdown",
-                "values": ["true", "false"],
-                "descriptions": {
-                    "true": "Use advanced techniques to find more emails",
-                    "false": "Use standard email detection only"
-                }
-            },
-            "email_finder_dns_check": {
-                "type": "dropdown",
-                "values": ["true", "false"],
-                "descriptions": {
-                    "true": "Validate email domains using DNS (slower but more accurate)",
-                    "false": "Skip domain validation (faster but may include invalid emails)"
-                }
-            },
-            "email_finder_ai_heuristics": {
-                "type": "dropdown",
-                "values": ["true", "false"],
-                "descriptions": {
-                    "true": "Use AI-based techniques to find obfuscated emails",
-                    "false": "Use only pattern matching for email detection"
-                }
-            }, 
-            "email_finder_max_depth": {
-                "type": "dropdown",
-                "values": ["0", "1", "2", "3"],
-                "descriptions": {
-                    "0": "Don't scan linked websites",
-                    "1": "Scan only direct links",
-                    "2": "Scan up to 2 levels deep (recommended)",
-                    "3": "Deep scan up to 3 levels (slower)"
-                }
+        # Настройки с описаниями: (label, description) из ключей "<key>_label" / "<key>_desc"
+        _t = self.get_translation
+        settings_info = self._settings_info_cache.get(self.language)
+        if settings_info is None:
+            settings_info = self._settings_info_cache[self.language] = {
+                key: (_t(f"{key}_label"), _t(f"{key}_desc"))
+                for key in self.SETTING_KEYS
             }
-        }
     
+        # Basic settings first; None marks the collapsed Advanced Email Finder section after them
+        ordered = [key for key in settings_info if key not in _ADVANCED_SETTING_KEYS]
+        ordered.append(None)
+        
         # Добавляем заголовок раздела для основных настроек
-        ttk.Label(scrollable_frame, text="Basic Settings", font=("Arial", 12, "bold")).grid(
+        ttk.Label(scrollable_frame, text="Basic Settings", font=self._font_heading).grid(
             row=row, column=0, columnspan=3, sticky=tk.W, padx=5, pady=10
         )
         row += 1
     
         # Итерируем по всем настройкам и создаем их элементы управления
-        for key, (label, description) in settings_info.items():
-            # Пропускаем настройки Advanced Email Finder для отдельного раздела
-            if key in ["use_advanced_email_finder", "email_finder_max_depth", "email_finder_dns_check", "email_finder_ai_heuristics"]:
-                continue
-            
-            # Проверяем, есть ли специальная обработка для этого ключа
-            if key in special_settings and special_settings[key]["type"] == "dropdown":
-                # Создаем метку
-                ttk.Label(scrollable_frame, text=f"{label}:", font=("Arial", 10, "bold")).grid(
-                    row=row, column=0, sticky=tk.W, padx=5, pady=2
+        for key in ordered:
+            if key is None:
+                # Добавляем разделитель и заголовок раздела для Advanced Email Finder
+                ttk.Separator(scrollable_frame, orient=tk.HORIZONTAL).grid(
+                    row=row, column=0, columnspan=3, sticky=tk.EW, pady=10
                 )
-            
-                # Создаем выпадающий список вместо текстового поля
-                values = special_settings[key]["values"]
-                combo = ttk.Combobox(scrollable_frame, values=values, state="readonly", width=18)
-                combo.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-            
-                # Устанавливаем текущее значение
-                current_value = current_settings.get(key, values[-1])  # По умолчанию последнее значение
-                combo.set(current_value)
-            
-                # Описания для режимов
-                descriptions = special_settings[key]["descriptions"]
-                if key in ["shorts_filter_mode"]:
-                    # Для описаний, которые требуют перевода
-                    descriptions = {val: self.get_translation(desc) for val, desc in descriptions.items()}
-            
-                desc_label = ttk.Label(scrollable_frame, text=descriptions.get(current_value, ""), 
-                                  font=("Arial", 8), foreground="gray")
-                desc_label.grid(row=row, column=2, sticky=tk.W, padx=5, pady=2)
-            
-                # Обновление описания при изменении выбора
-                def update_desc(event, desc_label=desc_label, descriptions=descriptions):
-                    desc_label.config(text=descriptions.get(combo.get(), ""))
-            
-                combo.bind("<<ComboboxSelected>>", update_desc)
-            
-                # Сохраняем в словаре полей
-                settings_entries[key] = combo
-                row += 1
-                continue  # Пропускаем стандартное создание текстового поля
-        
-            # Label
-            ttk.Label(scrollable_frame, text=f"{label}:", font=("Arial", 10, "bold")).grid(
-                row=row, column=0, sticky=tk.W, padx=5, pady=2
-            )
-        
-            # Entry
-            entry = ttk.Entry(scrollable_frame, width=20)
-            entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-            entry.insert(0, current_settings.get(key, ""))
-        
-            # Description
-            ttk.Label(scrollable_frame, text=description, font=("Arial", 8), foreground="gray").grid(
-                row=row, column=2, sticky=tk.W, padx=5, pady=2
-            )
-        
-            settings_entries[key] = entry
-            row += 1
-    
-        # Добавляем разделитель
-        ttk.Separator(scrollable_frame, orient=tk.HORIZONTAL).grid(
-            row=row, column=0, columnspan=3, sticky=tk.EW, pady=10
-        )
-        row += 1
-    
-        # Добавляем заголовок раздела для Advanced Email Finder
-        ttk.Label(scrollable_frame, text="Advanced Email Finder Settings", font=("Arial", 12, "bold")).grid(
-            row=row, column=0, columnspan=3, sticky=tk.W, padx=5, pady=10
-        )
-        row += 1
-    
-        # Добавляем настройки для Advanced Email Finder
-        advanced_keys = ["use_advanced_email_finder", "email_finder_max_depth", "email_finder_dns_check", "email_finder_ai_heuristics"]
-        for key in advanced_keys:
-            label, description = settings_info[key]
-        
-            # Проверяем, есть ли специальная обработка для этого ключа
-            if key in special_settings and special_settings[key]["type"] == "dropdown":
-                # Создаем метку
-                ttk.Label(scrollable_frame, text=f"{label}:", font=("Arial", 10, "bold")).grid(
-                    row=row, column=0, sticky=tk.W, padx=5, pady=2
+                # Its rows are only built when the user expands the section; their grid rows are kept free
+                expand_button = ttk.Button(
+                    scrollable_frame,
+                    text="▶ Advanced Email Finder Settings",
+                    command=self._expand_advanced_settings
                 )
+                expand_button.grid(row=row + 1, column=0, columnspan=3, sticky=tk.W, padx=5, pady=10)
+                self._adv_ctx = (scrollable_frame, expand_button, row + 2, settings_info, settings_entries)
+                row += 2 + len(_ADVANCED_SETTING_KEYS)
+                continue
             
-                # Создаем выпадающий список вместо текстового поля
-                values = special_settings[key]["values"]
-                combo = ttk.Combobox(scrollable_frame, values=values, state="readonly", width=18)
-                combo.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-            
-                # Устанавливаем текущее значение
-                current_value = current_settings.get(key, values[-1])  # По умолчанию последнее значение
-                combo.set(current_value)
-            
-                # Описания для режимов
-                descriptions = special_settings[key]["descriptions"]
-            
-                desc_label = ttk.Label(scrollable_frame, text=descriptions.get(current_value, ""), 
-                                  font=("Arial", 8), foreground="gray")
-                desc_label.grid(row=row, column=2, sticky=tk.W, padx=5, pady=2)
-            
-                # Обновление описания при изменении выбора
-                def update_desc(event, desc_label=desc_label, descriptions=descriptions):
-                    desc_label.config(text=descriptions.get(combo.get(), ""))
-             
-                combo.bind("<<ComboboxSelected>>", update_desc)
-            
-                # Сохраняем в словаре полей
-                settings_entries[key] = combo
-                row += 1
-                continue  # Пропускаем стандартное создание текстового поля
-        
-            # Label
-            ttk.Label(scrollable_frame, text=f"{label}:", font=("Arial", 10, "bold")).grid(
-                row=row, column=0, sticky=tk.W, padx=5, pady=2
-            )
-        
-            # Entry
-            entry = ttk.Entry(scrollable_frame, width=20)
-            entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
-            entry.insert(0, current_settings.get(key, ""))
-        
-            # Description
-            ttk.Label(scrollable_frame, text=description, font=("Arial", 8), foreground="gray").grid(
-                row=row, column=2, sticky=tk.W, padx=5, pady=2
-            )
-         
-            settings_entries[key] = entry
+            label, description = settings_info[key]
+            self._add_setting_row(scrollable_frame, row, key, label, description, current_settings, settings_entries)
             row += 1
     
         # Добавляем разделитель
@@ -1440,6 +1536,8 @@ class YouTubeScraperGUI:
         )
         row += 1
     
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        
         # Кнопка сохранения (в отдельном фрейме внизу окна)
         button_frame = ttk.Frame(settings_window)
         button_frame.pack(fill=tk.X, pady=10)
@@ -1450,19 +1548,112 @@ class YouTubeScraperGUI:
             command=lambda: self.save_settings(settings_entries, settings_window)
         )
         save_button.pack(padx=10, pady=5)
+        settings_window.update_idletasks()
+        
+        # Closing only hides the dialog so the next open skips building it
+        settings_window.protocol("WM_DELETE_WINDOW", settings_window.withdraw)
+        self._settings_window = settings_window
+        self._settings_entries = settings_entries
+    
+    def _add_setting_row(self, frame, row, key, label, description, current_settings, entries):
+        """Grid one settings row: a dropdown for keys in _SPECIAL_SETTINGS, otherwise a text entry"""
+        ttk.Label(frame, text=f"{label}:", font=self._font_label_bold).grid(
+            row=row, column=0, sticky=tk.W, padx=5, pady=2
+        )
+        
+        special = _SPECIAL_SETTINGS.get(key)
+        if special is not None and special["type"] == "dropdown":
+            # Создаем выпадающий список вместо текстового поля
+            values = special["values"]
+            combo = ttk.Combobox(frame, values=values, state="readonly", width=18)
+            combo.grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+            
+            # Устанавливаем текущее значение
+            current_value = current_settings.get(key, values[-1])  # По умолчанию последнее значение
+            combo.set(current_value)
+            
+            # Описания для режимов
+            descriptions = special["descriptions"]
+            if key == "shorts_filter_mode":
+                # Для описаний, которые требуют перевода
+                _t = self.get_translation
+                descriptions = {val: _t(desc) for val, desc in descriptions.items()}
+            
+            desc_label = ttk.Label(frame, text=descriptions.get(current_value, ""), 
+                                   font=self._font_desc, foreground="gray")
+            desc_label.grid(row=row, column=2, sticky=tk.W, padx=5, pady=2)
+            
+            # Обновление описания при изменении выбора
+            combo.desc_label = desc_label
+            combo.descriptions_map = descriptions
+            combo.bind("<<ComboboxSelected>>", self._on_combo_change)
+            
+            entries[key] = combo
+            return
+        
+        # Entry; the StringVar gives it its initial value at creation and is what save_settings reads
+        var = tk.StringVar(master=frame, value=current_settings.get(key, ""))
+        ttk.Entry(frame, width=20, textvariable=var).grid(row=row, column=1, sticky=tk.W, padx=5, pady=2)
+        
+        # Description
+        ttk.Label(frame, text=description, font=self._font_desc, foreground="gray").grid(
+            row=row, column=2, sticky=tk.W, padx=5, pady=2
+        )
+        
+        entries[key] = var
+    
+    def _expand_advanced_settings(self):
+        """Build the Advanced Email Finder rows of the settings dialog the first time they are shown"""
+        frame, button, row, settings_info, entries = self._adv_ctx
+        button.configure(text="▼ Advanced Email Finder Settings", state=tk.DISABLED)
+        
+        # Read now rather than at dialog build time, the dialog may have been reopened since
+        current_settings = self.load_settings_dict()
+        for key in _ADVANCED_SETTING_KEYS:
+            label, description = settings_info[key]
+            self._add_setting_row(frame, row, key, label, description, current_settings, entries)
+            row += 1
+    
+    def _on_combo_change(self, event):
+        """Show the description of the value picked in a settings dropdown"""
+        combo = event.widget
+        combo.desc_label.config(text=combo.descriptions_map.get(combo.get(), ""))
+    
+    def _fill_settings_entries(self, entries, current_settings):
+        """Show current_settings in the dropdowns and entry variables of an already built settings dialog"""
+        for key, widget in entries.items():
+            if isinstance(widget, ttk.Combobox):
+                widget.set(current_settings.get(key, widget["values"][-1]))
+                # Let the description next to the dropdown follow the new value
+                widget.event_generate("<<ComboboxSelected>>")
+            else:
+                # Text settings are held by their entry's StringVar
+                widget.set(current_settings.get(key, ""))
     
     def load_settings_dict(self):
         """Load settings from settings.txt into a dictionary"""
         settings = {}
         
         try:
-            with open(self.file_paths["settings"], 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        settings[key] = value
-            
+            path = self.file_paths["settings"]
+            st = os.stat(path)
+            cached = self._settings_cache
+            if cached and cached[:3] == (path, st.st_mtime_ns, st.st_size):
+                # File untouched since the last parse; hand out a copy so callers can't alter the cache
+                self.update_status("Settings", self.get_translation("loaded"), "green")
+                return dict(cached[3])
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            for line in text.splitlines():
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
+                key, sep, value = line.partition('=')
+                if sep:
+                    settings[key] = value
+            
+            self._settings_cache = (path, st.st_mtime_ns, st.st_size, dict(settings))
             self.update_status("Settings", self.get_translation("loaded"), "green")
         except Exception as e:
             self.gui_logger.log("ERROR", f"Error loading settings: {str(e)}")
@@ -1472,35 +1663,39 @@ class YouTubeScraperGUI:
     
     def save_settings(self, entries, window):
         """Save settings to the settings.txt file"""
+        # Start from the saved settings so rows that were never built (collapsed section) keep their values
+        settings = self.load_settings_dict() if os.path.exists(self.file_paths["settings"]) else {}
+        self._settings_cache = None
         try:
-            with open(self.file_paths["settings"], 'w', encoding='utf-8') as f:
-                for key, entry in entries.items():
-                    if hasattr(entry, 'get'):  # Для текстовых полей и выпадающих списков
-                        value = entry.get()
-                        f.write(f"{key}={value}\n")
+            # Для текстовых полей и выпадающих списков
+            for key, entry in entries.items():
+                if hasattr(entry, 'get'):
+                    settings[key] = entry.get()
+            
+            # The whole file goes out in one write
+            data = "".join(f"{key}={value}\n" for key, value in settings.items())
+            self._replace_file(self.file_paths["settings"], data.encode('utf-8'))
             
             self.gui_logger.log("INFO", self.get_translation("settings_saved_successfully"))
             self.update_status("Settings", self.get_translation("saved"), "green")
             
-            # Close the settings window
-            window.destroy()
+            # Hide the settings window; it is reused on the next open
+            window.withdraw()
             
         except Exception as e:
             error_msg = self.get_translation("error_saving_file").format(self.file_paths["settings"], str(e))
             self.gui_logger.log("ERROR", error_msg)
             
             # Log detailed error to debug.txt
-            with open("debug.txt", "a") as f:
-                f.write(f"=== SETTINGS ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("SETTINGS ERROR", error_msg)
             
-            messagebox.showerror(self.get_translation("error"), error_msg)
+            self.root.after_idle(messagebox.showerror, self.get_translation("error"), error_msg)
     
     def open_file_paths(self):
         """Open the file paths editor window"""
+        _t = self.get_translation
         paths_window = tk.Toplevel(self.root)
-        paths_window.title(self.get_translation("file_paths_window_title"))
+        paths_window.title(_t("file_paths_window_title"))
         paths_window.geometry("700x500")
         paths_window.configure(bg=self.colors["bg"])
         
@@ -1510,23 +1705,18 @@ class YouTubeScraperGUI:
         
         # File paths with descriptions
         path_info = {
-            "keywords": (self.get_translation("keywords_file_label"), self.get_translation("keywords_file_desc")),
-            "proxy": (self.get_translation("proxy_file_label"), self.get_translation("proxy_file_desc")),
-            "settings": (self.get_translation("settings_file_label"), self.get_translation("settings_file_desc")),
-            "blacklist": (self.get_translation("blacklist_file_label"), self.get_translation("blacklist_file_desc")),
-            "api": (self.get_translation("api_file_label"), self.get_translation("api_file_desc")),
-            "channels": (self.get_translation("channels_file_label"), self.get_translation("channels_file_desc")),
-            "emails": (self.get_translation("emails_file_label"), self.get_translation("emails_file_desc")),
-            "social_media": (self.get_translation("social_media_file_label"), self.get_translation("social_media_file_desc"))
+            key: (_t(f"{key}_file_label"), _t(f"{key}_file_desc"))
+            for key in self.PATH_KEYS
         }
         
         # Create entries for each file path
         path_entries = {}
         row = 0
+        browse_text = _t("browse_btn")
         
         for key, (label, description) in path_info.items():
             # Label
-            ttk.Label(frame, text=f"{label}:", font=("Arial", 10, "bold")).grid(
+            ttk.Label(frame, text=f"{label}:", font=self._font_label_bold).grid(
                 row=row, column=0, sticky=tk.W, padx=5, pady=2
             )
             
@@ -1538,13 +1728,13 @@ class YouTubeScraperGUI:
             # Browse button
             browse_button = ttk.Button(
                 frame,
-                text=self.get_translation("browse_btn"),
+                text=browse_text,
                 command=lambda e=entry: self.browse_file(e)
             )
             browse_button.grid(row=row, column=2, padx=5, pady=2)
             
             # Description
-            ttk.Label(frame, text=description, font=("Arial", 8), foreground="gray").grid(
+            ttk.Label(frame, text=description, font=self._font_desc, foreground="gray").grid(
                 row=row, column=3, sticky=tk.W, padx=5, pady=2
             )
             
@@ -1560,31 +1750,51 @@ class YouTubeScraperGUI:
         # Save button
         save_button = ttk.Button(
             frame, 
-            text=self.get_translation("save_file_paths_btn"),
+            text=_t("save_file_paths_btn"),
             command=lambda: self.save_file_paths(path_entries, paths_window)
         )
         save_button.grid(row=row, column=0, columnspan=4, pady=10)
     
     def browse_file(self, entry_widget):
         """Open a file browser and update the entry widget with the selected file path"""
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(defaultextension=".txt")
         if file_path:
             entry_widget.delete(0, tk.END)
             entry_widget.insert(0, file_path)
     
+    @staticmethod
+    def _replace_file(path, data):
+        """Write bytes to a temp file next to path, then swap it in so readers never see a partial file"""
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Don't leave a partial temp file behind when the write or swap fails
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def save_file_paths(self, entries, window):
         """Save the file paths and close the window"""
         try:
             # Update the file paths dictionary
             for key, entry in entries.items():
                 self.file_paths[key] = entry.get()
+            self._index_file_paths()
             
             # Save file paths to a JSON file for persistence
-            with open("file_paths.json", 'w', encoding='utf-8') as f:
-                json.dump(self.file_paths, f, indent=4)
+            self._replace_file("file_paths.json", _json_dumps(self.file_paths))
             
             self.gui_logger.log("INFO", self.get_translation("file_paths_saved_successfully"))
             
+            # Refresh status indicators; files at unchanged paths are not re-read
+            self.check_files_status()
+            
             # Close the window
             window.destroy()
             
@@ -1592,33 +1802,34 @@ class YouTubeScraperGUI:
             error_msg = self.get_translation("error_loading_file_paths").format(str(e))
             self.gui_logger.log("ERROR", error_msg)
             
-            with open("debug.txt", "a") as f:
-                f.write(f"=== FILE PATHS ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("FILE PATHS ERROR", error_msg)
             
-            messagebox.showerror(self.get_translation("error"), error_msg)
+            self.root.after_idle(messagebox.showerror, self.get_translation("error"), error_msg)
+    
+    def _index_file_paths(self):
+        """Rebuild the path -> file type index; call after any change to self.file_paths"""
+        # Reversed so that, as with a forward scan, the first key wins when two share a path
+        self._file_paths_inv = {path: key for key, path in reversed(self.file_paths.items())}
     
     def load_file_paths(self):
         """Load file paths from file_paths.json if it exists"""
         try:
-            if os.path.exists("file_paths.json"):
-                with open("file_paths.json", 'r', encoding='utf-8') as f:
-                    saved_paths = json.load(f)
-                    
-                    # Update the file paths dictionary
-                    for key, path in saved_paths.items():
-                        if key in self.file_paths:
-                            self.file_paths[key] = path
-                
-                self.gui_logger.log("INFO", self.get_translation("file_paths_loaded_successfully"))
+            with open("file_paths.json", 'rb') as f:
+                saved_paths = _json_loads(f.read())
+            
+            # Update the file paths dictionary; unknown keys in the file are ignored
+            file_paths = self.file_paths
+            file_paths.update({key: path for key, path in saved_paths.items() if key in file_paths})
+            self._index_file_paths()
+            
+            self.gui_logger.log("INFO", self.get_translation("file_paths_loaded_successfully"))
+        except FileNotFoundError:
+            # Nothing saved yet, keep the defaults
+            pass
         except Exception as e:
             self.gui_logger.log("ERROR", self.get_translation("error_loading_file_paths").format(str(e)))
             
-            with open("debug.txt", "a") as f:
-                f.write(f"=== FILE PATHS LOAD ERROR AT {datetime.now()} ===\n")
-                f.write(f"Error loading file paths: {str(e)}\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("FILE PATHS LOAD ERROR", f"Error loading file paths: {str(e)}")
     
     def open_file_editor(self, file_key):
         """Open a simple editor for the specified file"""
@@ -1644,37 +1855,32 @@ class YouTubeScraperGUI:
         
         # Load the file content
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    text_widget.insert(tk.END, content)
-            else:
-                # Create file with default content
-                default_content = ""
-                if file_key == "keywords":
-                    default_content = "music\ngaming\ntutorial\ntech\nvlog\n"
-                elif file_key == "proxy":
-                    default_content = "# Format: ip:port:login:password\n"
-                elif file_key == "settings":
-                    default_content = "min_subscribers=1000\nmax_subscribers=1000000\n"
-                    default_content += "min_total_views=10000\ncreation_year_limit=2015\n"
-                    default_content += "delay_min=0.5\ndelay_max=2\nparse_mode=email\n"
-                    default_content += "max_workers=5\nbatch_size=50\nuse_caching=true\n"
-                    default_content += "shorts_filter_mode=3\n"
-                elif file_key == "blacklist":
-                    default_content = "IN\nBR\nPK\n"
-                elif file_key == "api":
-                    default_content = "# Enter your YouTube API keys here, one per line\n"
-                
-                text_widget.insert(tk.END, default_content)
-                
+            with open(file_path, 'r', encoding='utf-8') as f:
+                text_widget.insert(tk.END, f.read())
+        except FileNotFoundError:
+            # Create file with default content
+            default_content = ""
+            if file_key == "keywords":
+                default_content = "music\ngaming\ntutorial\ntech\nvlog\n"
+            elif file_key == "proxy":
+                default_content = "# Format: ip:port:login:password\n"
+            elif file_key == "settings":
+                default_content = "min_subscribers=1000\nmax_subscribers=1000000\n"
+                default_content += "min_total_views=10000\ncreation_year_limit=2015\n"
+                default_content += "parse_mode=email\n"
+                default_content += "max_workers=5\nbatch_size=50\nuse_caching=true\n"
+                default_content += "shorts_filter_mode=3\n"
+            elif file_key == "blacklist":
+                default_content = "IN\nBR\nPK\n"
+            elif file_key == "api":
+                default_content = "# Enter your YouTube API keys here, one per line\n"
+            
+            text_widget.insert(tk.END, default_content)
+        
         except Exception as e:
             self.gui_logger.log("ERROR", self.get_translation("error_loading_file").format(file_path, str(e)))
             
-            with open("debug.txt", "a") as f:
-                f.write(f"=== FILE EDITOR ERROR AT {datetime.now()} ===\n")
-                f.write(f"Error loading file {file_path}: {str(e)}\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("FILE EDITOR ERROR", f"Error loading file {file_path}: {str(e)}")
         
         # Create save button
         save_button = ttk.Button(
@@ -1687,22 +1893,20 @@ class YouTubeScraperGUI:
     def save_file_content(self, file_path, text_widget, window):
         """Save the content of the text widget to the specified file"""
         try:
-            content = text_widget.get(1.0, tk.END)
-            
             # Make sure the directory exists
             os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
             
+            # Copy the text out of Tk in blocks of lines rather than as one string of the whole file
+            end_line = int(text_widget.index(tk.END).split('.')[0])
+            step = self.SAVE_CHUNK_LINES
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                for start in range(1, end_line, step):
+                    f.write(text_widget.get(f"{start}.0", f"{start + step}.0"))
             
             self.gui_logger.log("INFO", self.get_translation("file_saved").format(file_path))
             
             # Get the file type from the path
-            file_type = None
-            for key, path in self.file_paths.items():
-                if path == file_path:
-                    file_type = key
-                    break
+            file_type = self._file_paths_inv.get(file_path)
             
             if file_type:
                 self.update_status(file_type.capitalize(), self.get_translation("saved"), "green")
@@ -1714,12 +1918,9 @@ class YouTubeScraperGUI:
             error_msg = self.get_translation("error_saving_file").format(file_path, str(e))
             self.gui_logger.log("ERROR", error_msg)
             
-            with open("debug.txt", "a") as f:
-                f.write(f"=== FILE SAVE ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("FILE SAVE ERROR", error_msg)
             
-            messagebox.showerror(self.get_translation("error"), error_msg)
+            self.root.after_idle(messagebox.showerror, self.get_translation("error"), error_msg)
     
     def open_file_viewer(self, file_path):
         """Open a simple viewer for the specified file"""
@@ -1737,27 +1938,45 @@ class YouTubeScraperGUI:
         text_widget = scrolledtext.ScrolledText(frame, width=80, height=30)
         text_widget.pack(fill=tk.BOTH, expand=True, pady=5)
         
-    # Load the file content
+        # Load the file content
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    text_widget.insert(tk.END, content)
-                text_widget.configure(state='disabled')  # Make read-only
-            else:
-                text_widget.insert(tk.END, self.get_translation("file_not_found").format(file_path))
-                text_widget.configure(state='disabled')  # Make read-only
-                
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            content = self.get_translation("file_not_found").format(file_path)
         except Exception as e:
-            self.gui_logger.log("ERROR", self.get_translation("error_loading_file").format(file_path, str(e)))
-            text_widget.insert(tk.END, self.get_translation("error_loading_file").format(file_path, str(e)))
+            content = self.get_translation("error_loading_file").format(file_path, str(e))
+            self.gui_logger.log("ERROR", content)
+        
+        self._insert_readonly(text_widget, content)
+    
+    def _insert_readonly(self, text_widget, content):
+        """Fill a text widget and make it read-only; large content goes in over several idle callbacks"""
+        step = self.INSERT_CHUNK_CHARS
+        if len(content) <= self.CHUNKED_INSERT_MIN_CHARS:
+            text_widget.insert(tk.END, content)
             text_widget.configure(state='disabled')  # Make read-only
+            return
+        
+        def insert_next(start):
+            # The window may have been closed while the file was still going in
+            if not text_widget.winfo_exists():
+                return
+            text_widget.insert(tk.END, content[start:start + step])
+            if start + step < len(content):
+                # Queued from inside an idle callback, so pending events and redraws run first
+                self.root.after_idle(insert_next, start + step)
+            else:
+                text_widget.configure(state='disabled')  # Make read-only once the last chunk is in
+        
+        insert_next(0)
     
     def view_results(self):
         """View the results of the scraper"""
         # Create a new window
+        _t = self.get_translation
         results_window = tk.Toplevel(self.root)
-        results_window.title(self.get_translation("results_window_title"))
+        results_window.title(_t("results_window_title"))
         results_window.geometry("800x600")
         results_window.configure(bg=self.colors["bg"])
         
@@ -1767,10 +1986,11 @@ class YouTubeScraperGUI:
         
         # Create tabs for different result types
         tab_info = [
-            (self.get_translation("channels_tab"), self.file_paths["channels"]),
-            (self.get_translation("emails_tab"), self.file_paths["emails"]),
-            (self.get_translation("social_media_tab"), self.file_paths["social_media"])
+            (_t("channels_tab"), self.file_paths["channels"]),
+            (_t("emails_tab"), self.file_paths["emails"]),
+            (_t("social_media_tab"), self.file_paths["social_media"])
         ]
+        not_found_text, load_error_text, export_text = _t("file_not_found"), _t("error_loading_file"), _t("export_btn")
         
         for tab_name, file_path in tab_info:
             # Create a frame for the tab
@@ -1783,21 +2003,19 @@ class YouTubeScraperGUI:
             
             # Load the file content
             try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        text_widget.insert(tk.END, content)
-                else:
-                    text_widget.insert(tk.END, self.get_translation("file_not_found").format(file_path))
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                content = not_found_text.format(file_path)
             except Exception as e:
-                text_widget.insert(tk.END, self.get_translation("error_loading_file").format(file_path, str(e)))
+                content = load_error_text.format(file_path, str(e))
             
-            text_widget.configure(state='disabled')  # Make read-only
+            self._insert_readonly(text_widget, content)
             
             # Add export button for this tab
             export_button = ttk.Button(
                 tab_frame,
-                text=self.get_translation("export_btn").format(tab_name),
+                text=export_text.format(tab_name),
                 command=lambda path=file_path: self.export_to_csv(path)
             )
             export_button.pack(pady=5)
@@ -1810,6 +2028,7 @@ class YouTubeScraperGUI:
             return
         
         # Get the export path
+        from tkinter import filedialog
         export_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
@@ -1819,9 +2038,8 @@ class YouTubeScraperGUI:
             return
         
         try:
-            # Simply copy the file since it's already in CSV format
-            with open(file_path, 'r', encoding='utf-8') as src, open(export_path, 'w', encoding='utf-8') as dst:
-                dst.write(src.read())
+            # Simply copy the file since it's already in CSV format; a byte copy skips decoding and lets the OS do it
+            shutil.copyfile(file_path, export_path)
             
             self.gui_logger.log("INFO", self.get_translation("export_success_msg").format(export_path))
             messagebox.showinfo(self.get_translation("export_successful"), 
@@ -1831,17 +2049,15 @@ class YouTubeScraperGUI:
             error_msg = self.get_translation("export_error_msg").format(str(e))
             self.gui_logger.log("ERROR", error_msg)
             
-            with open("debug.txt", "a") as f:
-                f.write(f"=== EXPORT ERROR AT {datetime.now()} ===\n")
-                f.write(error_msg + "\n")
-                f.write(traceback.format_exc() + "\n\n")
+            self._log_debug("EXPORT ERROR", error_msg)
             
-            messagebox.showerror(self.get_translation("export_error"), error_msg)
+            self.root.after_idle(messagebox.showerror, self.get_translation("export_error"), error_msg)
     
     def show_about(self):
         """Show information about the application"""
+        _t = self.get_translation
         about_window = tk.Toplevel(self.root)
-        about_window.title(self.get_translation("about_window_title"))
+        about_window.title(_t("about_window_title"))
         about_window.geometry("400x300")
         about_window.configure(bg=self.colors["bg"])
         
@@ -1849,7 +2065,7 @@ class YouTubeScraperGUI:
         # (You can replace this with an actual logo if available)
         logo_label = ttk.Label(
             about_window, 
-            text=self.get_translation("about_app_name"), 
+            text=_t("about_app_name"), 
             font=("Arial", 24, "bold"),
             foreground=self.colors["error"]
         )
@@ -1857,8 +2073,8 @@ class YouTubeScraperGUI:
         
         # Add application info
         info_text = (
-            f"{self.get_translation('about_app_version')}\n\n"
-            f"{self.get_translation('about_app_description')}"
+            f"{_t('about_app_version')}\n\n"
+            f"{_t('about_app_description')}"
         )
         
         info_label = ttk.Label(
@@ -1872,7 +2088,7 @@ class YouTubeScraperGUI:
         # Add close button
         close_button = ttk.Button(
             about_window,
-            text=self.get_translation("close_btn"),
+            text=_t("close_btn"),
             command=about_window.destroy
         )
         close_button.pack(pady=20)
@@ -1908,6 +2124,9 @@ def main():
             with open("debug.txt", "w", encoding="utf-8") as f:
                 f.write(f"=== DEBUG LOG CREATED AT {datetime.now()} ===\n\n")
         
+        # Install the debug.txt handler before anything can fail, so main's error entry goes through it
+        setup_logging()
+        
         # Create root window
         root = tk.Tk()
         app = YouTubeScraperGUI(root)
@@ -1920,10 +2139,7 @@ def main():
         
     except Exception as e:
         # If an unhandled exception occurs, log it to debug.txt
-        with open("debug.txt", "a") as f:
-            f.write(f"=== UNHANDLED ERROR AT {datetime.now()} ===\n")
-            f.write(f"Error: {str(e)}\n")
-            f.write(traceback.format_exc() + "\n\n")
+        _debug_logger.error("=== UNHANDLED ERROR ===\nError: %s", e, exc_info=True)
         
         # Show an error message
         tk.messagebox.showerror(